@@ -1,62 +1,127 @@
 # 🚀 Pet Performance Optimization Settings
 
+import sys
+from collections import deque
+from dataclasses import asdict, dataclass
+from types import MappingProxyType
+
+# Slotted dataclasses need Python 3.10+; older interpreters still get frozen ones
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
 # Optimal settings for best performance vs functionality balance
-PERFORMANCE_CONFIG = {
+@dataclass(frozen=True, **_SLOTS)
+class PerfConfig:
     # UI Performance
-    "ui_frame_rate": 30,           # FPS for UI updates (30 is smooth, 60 is excessive)
-    "ui_update_interval": 0.033,   # 1/30 seconds per frame
+    ui_frame_rate: int = 30               # FPS for UI updates (30 is smooth, 60 is excessive)
     
     # Screen Monitoring
-    "screen_capture_interval": 5.0,  # Screenshot every 5 seconds (vs 2 seconds)
-    "screen_resize_threshold": 0.8,  # Resize screenshots to 80% for memory
+    screen_capture_interval: float = 5.0  # Screenshot every 5 seconds (vs 2 seconds)
+    screen_resize_threshold: float = 0.8  # Resize screenshots to 80% for memory
     
-    # Memory Management  
-    "max_conversation_history": 50,  # Limit chat history
-    "max_activity_history": 20,      # Limit activity tracking
-    "max_screenshot_cache": 5,       # Keep only 5 recent screenshots
+    # Memory Management
+    max_conversation_history: int = 50    # Limit chat history
+    max_activity_history: int = 20        # Limit activity tracking
+    max_screenshot_cache: int = 5         # Keep only 5 recent screenshots
     
     # AI/API Optimization
-    "ai_response_timeout": 15,       # 15 second timeout for AI responses
-    "ai_context_limit": 1000,        # Limit AI context tokens
-    "rate_limit_calls": 10,          # Max 10 AI calls per minute
+    ai_response_timeout: int = 15         # 15 second timeout for AI responses
+    ai_context_limit: int = 1000          # Limit AI context tokens
+    rate_limit_calls: int = 10            # Max 10 AI calls per minute
     
     # Background Tasks
-    "spontaneous_check_interval": 60,  # Check every 60 seconds (vs 30)
-    "idle_sleep_multiplier": 2,        # Sleep 2x longer when user idle
-    "voice_processing_timeout": 10,     # Voice processing timeout
+    # (spontaneous check interval comes from SPONTANEOUS_INTERVAL_MODEL below)
+    idle_sleep_multiplier: int = 2        # Sleep 2x longer when user idle
+    voice_processing_timeout: int = 10    # Voice processing timeout
     
     # Resource Cleanup
-    "temp_file_cleanup_interval": 300,  # Clean temp files every 5 minutes
-    "memory_cleanup_threshold": 0.8,    # Clean memory at 80% usage
-    "gc_collection_interval": 120,      # Force garbage collection every 2 minutes
+    temp_file_cleanup_interval: int = 300  # Clean temp files every 5 minutes
+    memory_cleanup_threshold: float = 0.8  # Clean memory at 80% usage
+    gc_collection_interval: int = 120      # Force garbage collection every 2 minutes
+    
+    @property
+    def ui_update_interval(self) -> float:
+        """Seconds per frame"""
+        return 1 / self.ui_frame_rate
+
+PERF = PerfConfig()
+
+# Bounded histories: deques drop their oldest entry on append once full,
+# so the memory limits above hold without any manual trimming
+def make_conversation_history():
+    return deque(maxlen=PERF.max_conversation_history)
+
+def make_activity_history():
+    return deque(maxlen=PERF.max_activity_history)
+
+# Spontaneous conversation check interval, scaled by recent activity count.
+# Each end is (activity events, seconds); counts in between are linearly
+# interpolated and counts outside are clamped to the nearest end. The high
+# end is the activity history cap, the most events that can ever be counted.
+SPONTANEOUS_INTERVAL_MODEL = {
+    "low": (0, 60.0),                              # Quiet: the base 60 second check
+    "high": (PERF.max_activity_history, 300.0),    # Busy: back off to every 5 minutes
 }
 
+# Only activities that started within this many seconds count as recent
+SPONTANEOUS_ACTIVITY_WINDOW = 600.0
+
+def compute_interval(n_active, model=SPONTANEOUS_INTERVAL_MODEL):
+    """Seconds to wait before the next spontaneous check for n_active recent events"""
+    low_count, low_interval = model["low"]
+    high_count, high_interval = model["high"]
+    
+    if n_active <= low_count:
+        return low_interval
+    if n_active >= high_count:
+        return high_interval
+    
+    ratio = (n_active - low_count) / (high_count - low_count)
+    return low_interval + ratio * (high_interval - low_interval)
+
+# Read-only dict view of the settings above for code that still indexes
+# PERFORMANCE_CONFIG["..."]; new code should read PERF attributes
+PERFORMANCE_CONFIG = MappingProxyType({
+    **asdict(PERF),
+    "ui_update_interval": PERF.ui_update_interval,
+    "spontaneous_check_interval": SPONTANEOUS_INTERVAL_MODEL["low"][1],
+})
+
 # Theme-specific optimizations
-THEME_PERFORMANCE = {
-    "cardboard": {
-        "animation_steps": 8,      # Reduced animation steps for cardboard theme
-        "wobble_duration": 200,    # Shorter wobble animations
-        "texture_quality": "low",  # Lower quality textures
-    },
-    "modern": {
-        "animation_steps": 12,     # Smooth animations for modern theme
-        "fade_duration": 150,      # Quick fades
-        "blur_quality": "medium",  # Balanced blur effects
-    }
-}
+@dataclass(frozen=True, **_SLOTS)
+class CardboardThemePerformance:
+    animation_steps: int = 8              # Reduced animation steps for cardboard theme
+    wobble_duration: int = 200            # Shorter wobble animations
+    texture_quality: str = "low"          # Lower quality textures
+
+@dataclass(frozen=True, **_SLOTS)
+class ModernThemePerformance:
+    animation_steps: int = 12             # Smooth animations for modern theme
+    fade_duration: int = 150              # Quick fades
+    blur_quality: str = "medium"          # Balanced blur effects
+
+@dataclass(frozen=True, **_SLOTS)
+class ThemePerformance:
+    cardboard: CardboardThemePerformance = CardboardThemePerformance()
+    modern: ModernThemePerformance = ModernThemePerformance()
+
+THEME_PERFORMANCE = ThemePerformance()
 
 # Memory usage targets
-MEMORY_TARGETS = {
-    "conversation_history": "2 MB",    # Target memory for chat history
-    "activity_tracking": "1 MB",       # Target memory for activity data
-    "screenshot_cache": "10 MB",       # Target memory for screenshots
-    "ui_elements": "5 MB",             # Target memory for UI components
-}
+@dataclass(frozen=True, **_SLOTS)
+class MemoryTargets:
+    conversation_history: str = "2 MB"    # Target memory for chat history
+    activity_tracking: str = "1 MB"       # Target memory for activity data
+    screenshot_cache: str = "10 MB"       # Target memory for screenshots
+    ui_elements: str = "5 MB"             # Target memory for UI components
+
+MEMORY_TARGETS = MemoryTargets()
 
 # Performance monitoring flags
-PERFORMANCE_MONITORING = {
-    "enable_profiling": False,         # Enable detailed performance profiling
-    "log_slow_operations": True,       # Log operations taking >1 second
-    "memory_usage_warnings": True,     # Warn when memory usage is high
-    "fps_monitoring": False,           # Monitor actual UI frame rate
-}
\ No newline at end of file
+@dataclass(frozen=True, **_SLOTS)
+class MonitoringFlags:
+    enable_profiling: bool = False        # Enable detailed performance profiling
+    log_slow_operations: bool = True      # Log operations taking >1 second
+    memory_usage_warnings: bool = True    # Warn when memory usage is high
+    fps_monitoring: bool = False          # Monitor actual UI frame rate
+
+PERFORMANCE_MONITORING = MonitoringFlags()
\ No newline at end of file
@@ -1,4 +1,6 @@
 # -*- mode: python ; coding: utf-8 -*-
+# Generated by deploy_pixie.py - edit the script, not this file
+from PyInstaller.utils.hooks import collect_submodules
 
 
 a = Analysis(
@@ -6,33 +8,44 @@ a = Analysis(
     pathex=[],
     binaries=[],
     datas=[('assets', 'assets'), ('config', 'config'), ('src', 'src')],
-    hiddenimports=[],
+    hiddenimports=['PIL._tkinter_finder'] + collect_submodules('google.generativeai'),
     hookspath=[],
     hooksconfig={},
     runtime_hooks=[],
-    excludes=[],
+    excludes=['matplotlib', 'numpy', 'scipy', 'pandas', 'sklearn', 'IPython', 'notebook', 'pytest', 'test', 'tkinter.test', 'lib2to3', 'pydoc', 'pydoc_data', 'pip', 'setuptools', 'distutils', 'PyQt5', 'PyQt6', 'PySide2', 'PySide6', 'watchdog'],
     noarchive=False,
-    optimize=0,
+    optimize=2,
 )
+a.datas = [
+    d for d in a.datas
+    if not d[0].replace('\\', '/').startswith(('_tk_data/demos/', '_tk_data/msgs/', '_tcl_data/msgs/'))
+]
 pyz = PYZ(a.pure)
 
 exe = EXE(
     pyz,
     a.scripts,
-    a.binaries,
-    a.datas,
     [],
+    exclude_binaries=True,
     name='PixiePet',
     debug=False,
     bootloader_ignore_signals=False,
     strip=False,
-    upx=True,
-    upx_exclude=[],
-    runtime_tmpdir=None,
+    upx=False,
     console=False,
     disable_windowed_traceback=False,
     argv_emulation=False,
     target_arch=None,
     codesign_identity=None,
     entitlements_file=None,
+    icon='assets/pet/ghost.png',
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip=False,
+    upx=False,
+    upx_exclude=[],
+    name='PixiePet',
 )
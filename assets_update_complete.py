@@ -5,41 +5,55 @@ Shows the successful update from react-app/public/ to assets/pet/ folder.
 """
 
 import os
+import sys
+
+
+def _entry_size(entry):
+    """Size of a scandir entry in bytes, or None if it is missing"""
+    if entry is None:
+        return None
+    try:
+        return entry.stat().st_size
+    except OSError:
+        return None
+
 
 def show_assets_update_summary():
-    print("🎯 Assets Folder Update - COMPLETE!")
-    print("=" * 60)
+    # Collect the whole report and emit it with a single write
+    parts: list[str] = []
     
-    print("📂 PATH CHANGES:")
-    print("   ❌ BEFORE: react-app/public/ghost.png")
-    print("   ❌ BEFORE: react-app/public/clock.png") 
-    print("   ❌ BEFORE: react-app/public/house.png")
-    print()
-    print("   ✅ AFTER:  assets/pet/ghost.png")
-    print("   ✅ AFTER:  assets/pet/clock.png")
-    print("   ✅ AFTER:  assets/pet/house.png")
+    parts.append("🎯 Assets Folder Update - COMPLETE!")
+    parts.append("=" * 60)
     
-    print("\n📊 File Verification:")
+    parts.append("📂 PATH CHANGES:")
+    parts.append("   ❌ BEFORE: react-app/public/ghost.png")
+    parts.append("   ❌ BEFORE: react-app/public/clock.png") 
+    parts.append("   ❌ BEFORE: react-app/public/house.png")
+    parts.append("")
+    parts.append("   ✅ AFTER:  assets/pet/ghost.png")
+    parts.append("   ✅ AFTER:  assets/pet/clock.png")
+    parts.append("   ✅ AFTER:  assets/pet/house.png")
+    
+    parts.append("\n📊 File Verification:")
     assets_folder = "assets/pet/"
     images = ["ghost.png", "clock.png", "house.png"]
     
+    # One directory read instead of a stat per image
+    try:
+        entries = {entry.name: entry for entry in os.scandir(assets_folder)}
+    except OSError:
+        entries = {}
+    
     for img in images:
         path = assets_folder + img
-        exists = os.path.exists(path)
-        status = "✅ FOUND" if exists else "❌ MISSING"
-        size_info = ""
+        size = _entry_size(entries.get(img))
         
-        if exists:
-            try:
-                size = os.path.getsize(path)
-                size_kb = size / 1024
-                size_info = f" ({size_kb:.1f} KB)"
-            except:
-                size_info = ""
+        status = "✅ FOUND" if size is not None else "❌ MISSING"
+        size_info = f" ({size / 1024:.1f} KB)" if size is not None else ""
         
-        print(f"   {status} {path}{size_info}")
+        parts.append(f"   {status} {path}{size_info}")
     
-    print("\n🎭 Pet Options:")
+    parts.append("\n🎭 Pet Options:")
     pets = [
         ("👻 Ghost Pixie", "mysterious and helpful", "assets/pet/ghost.png"),
         ("⏰ Time Keeper", "punctual and organized", "assets/pet/clock.png"), 
@@ -47,30 +61,32 @@ def show_assets_update_summary():
     ]
     
     for name, personality, image_path in pets:
-        print(f"   {name}")
-        print(f"      Personality: {personality}")
-        print(f"      Image: {image_path}")
+        parts.append(f"   {name}")
+        parts.append(f"      Personality: {personality}")
+        parts.append(f"      Image: {image_path}")
+    
+    parts.append("\n🔧 Files Updated:")
+    parts.append("   ✅ config/settings.json - All image paths")
+    parts.append("   ✅ src/pet/pet_manager.py - Default and fallback paths")
+    parts.append("   ✅ All fallback image references")
     
-    print("\n🔧 Files Updated:")
-    print("   ✅ config/settings.json - All image paths")
-    print("   ✅ src/pet/pet_manager.py - Default and fallback paths")
-    print("   ✅ All fallback image references")
+    parts.append("\n🚀 How to Use:")
+    parts.append("   1. Run: python main.py")
+    parts.append("   2. Right-click the pet")
+    parts.append("   3. Settings ► Change Pet ►")
+    parts.append("   4. Select your favorite!")
+    parts.append("   5. Images now load from assets/pet/ folder!")
     
-    print("\n🚀 How to Use:")
-    print("   1. Run: python main.py")
-    print("   2. Right-click the pet")
-    print("   3. Settings ► Change Pet ►")
-    print("   4. Select your favorite!")
-    print("   5. Images now load from assets/pet/ folder!")
+    parts.append("\n✨ Benefits of Assets Folder:")
+    parts.append("   📁 Cleaner organization (assets separate from web)")
+    parts.append("   🔧 Easier to manage pet resources")
+    parts.append("   📦 Standard assets folder structure")
+    parts.append("   🎨 All pet images in one location")
     
-    print("\n✨ Benefits of Assets Folder:")
-    print("   📁 Cleaner organization (assets separate from web)")
-    print("   🔧 Easier to manage pet resources")
-    print("   📦 Standard assets folder structure")
-    print("   🎨 All pet images in one location")
+    parts.append(f"\n🎉 SUCCESS! Pet images now use the assets folder!")
+    parts.append("   The pet switching feature is fully functional with assets/pet/ images!")
     
-    print(f"\n🎉 SUCCESS! Pet images now use the assets folder!")
-    print("   The pet switching feature is fully functional with assets/pet/ images!")
+    sys.stdout.write("\n".join(parts) + "\n")
 
 if __name__ == "__main__":
-    show_assets_update_summary()
\ No newline at end of file
+    show_assets_update_summary()
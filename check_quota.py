@@ -4,13 +4,53 @@ Run this to see your current API status
 """
 
 import os
-import google.generativeai as genai
+import sys
+import json
+from datetime import datetime, date, time, timedelta, timezone
+from pathlib import Path
 from dotenv import load_dotenv
 
 # Load environment variables
 load_dotenv()
 
-def check_gemini_quota():
+# Remembers an exhausted quota so repeat checks don't spend a request to learn it again
+QUOTA_STATE_FILE = Path.home() / ".cache" / "pixie" / "quota_state.json"
+
+def _load_quota_state():
+    """Load the cached quota state, or None if there isn't a usable one"""
+    try:
+        with open(QUOTA_STATE_FILE, 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+def _save_quota_state(status, reset_at=None):
+    """Atomically write the quota state cache"""
+    state = {
+        "status": status,
+        "checked_at": datetime.now(timezone.utc).isoformat(),
+        "reset_at": reset_at.isoformat() if reset_at else None
+    }
+    try:
+        QUOTA_STATE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        tmp_file = QUOTA_STATE_FILE.with_suffix(".tmp")
+        with open(tmp_file, 'w', encoding='utf-8') as f:
+            json.dump(state, f)
+        os.replace(tmp_file, QUOTA_STATE_FILE)
+    except OSError:
+        pass
+
+def _next_quota_reset():
+    """Quota resets at midnight UTC"""
+    tomorrow = datetime.now(timezone.utc).date() + timedelta(days=1)
+    return datetime.combine(tomorrow, time.min, tzinfo=timezone.utc)
+
+def _is_daily_quota_error(error_msg):
+    """True only for errors naming the per-day quota (not per-minute rate limits)"""
+    lowered = error_msg.lower().replace(" ", "")
+    return "perday" in lowered or "daily" in lowered
+
+def check_gemini_quota(use_cache=True):
     """Check if Gemini API is working and quota status"""
     
     api_key = os.getenv('GEMINI_API_KEY')
@@ -18,20 +58,43 @@ def check_gemini_quota():
         print("❌ GEMINI_API_KEY not found in environment variables")
         return False
     
+    # Skip the API call while a previously seen quota exhaustion is still in effect
+    state = _load_quota_state() if use_cache else None
+    if state and state.get("status") == "exceeded" and state.get("reset_at"):
+        try:
+            reset_at = datetime.fromisoformat(state["reset_at"])
+        except ValueError:
+            reset_at = None
+        if reset_at and datetime.now(timezone.utc) < reset_at:
+            print("🚫 QUOTA EXCEEDED! (cached result, no API call made)")
+            print(f"   • Quota resets at {reset_at:%Y-%m-%d %H:%M} UTC")
+            return False
+    
     try:
+        # Imported here: the SDK pulls in grpc/protobuf, which the cached and
+        # missing-key paths above never need
+        import google.generativeai as genai
+        
         # Configure Gemini
         genai.configure(api_key=api_key)
         
         # Try to list models to check API access
         print("🔍 Checking Gemini API access...")
         
-        # Test with a simple request
+        # Test with a simple streamed request - the first chunk proves the API is live
         model = genai.GenerativeModel('gemini-2.0-flash-exp')
-        response = model.generate_content("Just say 'API Working' - nothing else")
+        stream = model.generate_content("Just say 'API Working' - nothing else", stream=True)
+        
+        response_text = ""
+        for chunk in stream:
+            if chunk.text:
+                response_text = chunk.text
+                break
         
-        if response.text:
+        if response_text:
+            _save_quota_state("ok")
             print("✅ Gemini API is working!")
-            print(f"📝 Response: {response.text.strip()}")
+            print(f"📝 Response: {response_text.strip()}")
             return True
         else:
             print("⚠️ API responded but no content returned")
@@ -42,11 +105,17 @@ def check_gemini_quota():
         print("❌ Gemini API Error:")
         print(f"   {error_msg}")
         
-        if "429" in error_msg or "quota" in error_msg.lower():
+        if ("429" in error_msg or "quota" in error_msg.lower()) and _is_daily_quota_error(error_msg):
+            # Only the daily quota is worth remembering until midnight UTC
+            _save_quota_state("exceeded", _next_quota_reset())
             print("\n🚫 QUOTA EXCEEDED!")
             print("   • You've reached your daily limit (50 requests)")
             print("   • Quota resets at midnight UTC")
             print("   • Pixie will use fallback responses until reset")
+        elif "429" in error_msg or "quota" in error_msg.lower():
+            print("\n⏳ RATE LIMITED!")
+            print("   • Too many requests in a short time")
+            print("   • Wait a minute and try again")
         elif "404" in error_msg:
             print("\n🔧 MODEL NOT FOUND!")
             print("   • The gemini-2.0-flash-exp model may not be available")
@@ -61,5 +130,6 @@ def check_gemini_quota():
 if __name__ == "__main__":
     print("🦎 Pixie's Gemini API Quota Checker")
     print("=" * 40)
-    check_gemini_quota()
+    # --force / --no-cache ignores a remembered quota exhaustion and asks the API
+    check_gemini_quota(use_cache=not ({"--force", "--no-cache"} & set(sys.argv[1:])))
     print("\n💡 Tip: Run this anytime to check your API status!")
\ No newline at end of file
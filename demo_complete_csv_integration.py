@@ -5,14 +5,13 @@ This demonstrates the complete workflow from pet activity logging
 to Google Sheets import - the 30-second integration approach.
 """
 
-import asyncio
 import sys
 import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 from src.pet.pet_manager import PetManager
 
-async def demo_csv_integration():
+def demo_csv_integration():
     print("🚀 Starting Pixie Pet with CSV Integration Demo")
     print("=" * 60)
     
@@ -73,12 +72,12 @@ async def demo_csv_integration():
         print(f"❌ Error during demo: {e}")
         return False
 
-async def main():
+def main():
     print("🎮 Pixie Pet - CSV Google Sheets Integration Demo")
     print("This demo shows how easy it is to get your pet's activity into Google Sheets")
     print()
     
-    success = await demo_csv_integration()
+    success = demo_csv_integration()
     
     if success:
         print("\n🏆 Demo completed successfully!")
@@ -92,4 +91,4 @@ async def main():
         print("\n❌ Demo encountered issues. Check the error messages above.")
 
 if __name__ == "__main__":
-    asyncio.run(main())
\ No newline at end of file
+    main()
\ No newline at end of file
@@ -3,94 +3,119 @@ Google Sheets Demo - No Credentials Required
 Shows how to interact with your blank Google Sheet
 """
 
+import sys
 import time
+from collections import namedtuple
 from datetime import datetime
 
-def demo_google_sheets_without_credentials():
+DemoOperation = namedtuple("DemoOperation", "action description data")
+
+_TODAY = datetime.now().strftime('%Y-%m-%d')
+
+# Sample operations shown by the demo, built once at import
+DEMO_OPERATIONS = (
+    DemoOperation(
+        "📝 Create Project Tracker",
+        "Transform your blank sheet into a project management tool",
+        (
+            ("Project Tracker - HackHarvard25", "", "", "", ""),
+            ("", "", "", "", ""),
+            ("Date", "Task", "Status", "Hours", "Notes"),
+            (_TODAY, "Setup Google Sheets Integration", "In Progress", "2", "Adding Pixie integration"),
+            (_TODAY, "Fix React JSX Error", "Completed", "0.5", "Fixed missing closing tag"),
+            (_TODAY, "Optimize Speech Bubble", "Completed", "1", "Made bubbles dynamic and clickable"),
+        ),
+    ),
+    DemoOperation(
+        "📋 Log Coding Activities",
+        "Automatically track your programming sessions",
+        (
+            ("Timestamp", "Activity", "File", "Duration", "Notes"),
+            ("2025-10-04 16:20", "Code editing", "Home.js", "15 min", "Fixed JSX structure"),
+            ("2025-10-04 16:25", "Integration work", "pet_manager.py", "30 min", "Added Google Sheets support"),
+            ("2025-10-04 16:30", "Testing", "main.py", "10 min", "Verified new features"),
+        ),
+    ),
+    DemoOperation(
+        "🔍 Screen Analysis Reports",
+        "AI-powered insights about your work",
+        (
+            ("Time", "Analysis Type", "Result", "Confidence"),
+            ("16:20", "Code Review", "React component structure looks good", "95%"),
+            ("16:25", "Error Detection", "Found JSX closing tag issue", "99%"),
+            ("16:30", "Productivity", "High focus session detected", "85%"),
+        ),
+    ),
+    DemoOperation(
+        "📊 Expense Tracking",
+        "Log expenses from receipts on screen",
+        (
+            ("Date", "Merchant", "Amount", "Category", "Notes"),
+            ("2025-10-04", "AWS", "$12.50", "Cloud Services", "Monthly hosting"),
+            ("2025-10-04", "GitHub", "$4.00", "Software", "Pro subscription"),
+            ("2025-10-04", "Coffee Shop", "$4.25", "Food", "Work fuel ☕"),
+        ),
+    ),
+)
+
+
+def _truncate_cell(cell, width=20):
+    """Shorten a cell for display, stringifying it only once"""
+    text = str(cell)
+    return text if len(text) <= width else text[:width] + '...'
+
+
+def demo_google_sheets_without_credentials(pace=False):
     """
     Demo showing what Pixie can do with Google Sheets
     This shows the functionality without requiring actual API access
+    
+    Pass pace=True (or run with --pace) to pause between operations.
     """
     
-    print("🎉 Google Sheets Integration Demo")
-    print("=" * 50)
+    # Collect output and write it in one go instead of one print per line
+    out = []
     
-    print("\n📊 What Pixie can do with your blank Google Sheet:")
+    out.append("🎉 Google Sheets Integration Demo")
+    out.append("=" * 50)
     
-    # Simulate various operations
-    operations = [
-        {
-            "action": "📝 Create Project Tracker",
-            "description": "Transform your blank sheet into a project management tool",
-            "data": [
-                ["Project Tracker - HackHarvard25", "", "", "", ""],
-                ["", "", "", "", ""],
-                ["Date", "Task", "Status", "Hours", "Notes"],
-                [datetime.now().strftime('%Y-%m-%d'), "Setup Google Sheets Integration", "In Progress", "2", "Adding Pixie integration"],
-                [datetime.now().strftime('%Y-%m-%d'), "Fix React JSX Error", "Completed", "0.5", "Fixed missing closing tag"],
-                [datetime.now().strftime('%Y-%m-%d'), "Optimize Speech Bubble", "Completed", "1", "Made bubbles dynamic and clickable"]
-            ]
-        },
-        {
-            "action": "📋 Log Coding Activities", 
-            "description": "Automatically track your programming sessions",
-            "data": [
-                ["Timestamp", "Activity", "File", "Duration", "Notes"],
-                ["2025-10-04 16:20", "Code editing", "Home.js", "15 min", "Fixed JSX structure"],
-                ["2025-10-04 16:25", "Integration work", "pet_manager.py", "30 min", "Added Google Sheets support"],
-                ["2025-10-04 16:30", "Testing", "main.py", "10 min", "Verified new features"]
-            ]
-        },
-        {
-            "action": "🔍 Screen Analysis Reports",
-            "description": "AI-powered insights about your work",
-            "data": [
-                ["Time", "Analysis Type", "Result", "Confidence"],
-                ["16:20", "Code Review", "React component structure looks good", "95%"],
-                ["16:25", "Error Detection", "Found JSX closing tag issue", "99%"],
-                ["16:30", "Productivity", "High focus session detected", "85%"]
-            ]
-        },
-        {
-            "action": "📊 Expense Tracking", 
-            "description": "Log expenses from receipts on screen",
-            "data": [
-                ["Date", "Merchant", "Amount", "Category", "Notes"],
-                ["2025-10-04", "AWS", "$12.50", "Cloud Services", "Monthly hosting"],
-                ["2025-10-04", "GitHub", "$4.00", "Software", "Pro subscription"],
-                ["2025-10-04", "Coffee Shop", "$4.25", "Food", "Work fuel ☕"]
-            ]
-        }
-    ]
+    out.append("\n📊 What Pixie can do with your blank Google Sheet:")
     
-    for i, op in enumerate(operations, 1):
-        print(f"\n{i}. {op['action']}")
-        print(f"   📄 {op['description']}")
-        print("   Sample data that would be inserted:")
+    for i, op in enumerate(DEMO_OPERATIONS, 1):
+        out.append(f"\n{i}. {op.action}")
+        out.append(f"   📄 {op.description}")
+        out.append("   Sample data that would be inserted:")
         
-        for row in op['data']:
-            print(f"      {' | '.join(str(cell)[:20] + '...' if len(str(cell)) > 20 else str(cell) for cell in row)}")
+        for row in op.data:
+            out.append(f"      {' | '.join(map(_truncate_cell, row))}")
         
-        time.sleep(0.5)
+        # Optional pacing for live demos; emit each operation before pausing
+        if pace:
+            sys.stdout.write("\n".join(out) + "\n")
+            sys.stdout.flush()
+            out.clear()
+            time.sleep(0.5)
+    
+    out.append("\n" + "=" * 50)
+    out.append("🚀 How to get started:")
+    out.append("1. Right-click Pixie → Google Sheets → Setup Google Sheets")
+    out.append("2. Follow the setup guide to get API credentials") 
+    out.append("3. Connect to your blank sheet using the Sheet ID from URL")
+    out.append("4. Start logging data automatically! 📊")
     
-    print("\n" + "=" * 50)
-    print("🚀 How to get started:")
-    print("1. Right-click Pixie → Google Sheets → Setup Google Sheets")
-    print("2. Follow the setup guide to get API credentials") 
-    print("3. Connect to your blank sheet using the Sheet ID from URL")
-    print("4. Start logging data automatically! 📊")
+    out.append("\n💡 Pro Tips:")
+    out.append("• Pixie can auto-detect coding sessions and log them")
+    out.append("• Screen analysis can extract data from receipts/invoices")
+    out.append("• Voice commands: 'Log this expense' or 'Create project tracker'")
+    out.append("• AI can categorize and organize your data automatically")
     
-    print("\n💡 Pro Tips:")
-    print("• Pixie can auto-detect coding sessions and log them")
-    print("• Screen analysis can extract data from receipts/invoices")
-    print("• Voice commands: 'Log this expense' or 'Create project tracker'")
-    print("• AI can categorize and organize your data automatically")
+    out.append("\n🎯 Perfect for:")
+    out.append("• Project management and time tracking")
+    out.append("• Expense and budget monitoring") 
+    out.append("• Code review and bug tracking")
+    out.append("• Productivity analysis and reporting")
     
-    print("\n🎯 Perfect for:")
-    print("• Project management and time tracking")
-    print("• Expense and budget monitoring") 
-    print("• Code review and bug tracking")
-    print("• Productivity analysis and reporting")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
-    demo_google_sheets_without_credentials()
\ No newline at end of file
+    demo_google_sheets_without_credentials(pace='--pace' in sys.argv)
\ No newline at end of file
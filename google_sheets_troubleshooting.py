@@ -93,4 +93,4 @@ authentication for security - you can't connect with just a URL.
 """
 
 if __name__ == "__main__":
-    print(open(__file__).read().split('"""')[1])
\ No newline at end of file
+    print(__doc__)
\ No newline at end of file
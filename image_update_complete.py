@@ -4,43 +4,45 @@ Pet Image Path Update - Verification Complete
 This shows the successful update from assets/pet/ to react-app/public/ folder.
 """
 
-import os
+import sys
+
+from src.utils.helpers import dir_entries
 
 def show_update_summary():
-    print("🖼️  Pet Image Path Update - COMPLETE!")
-    print("=" * 60)
+    # Lines are gathered here and written in one go at the end
+    out = []
+    
+    out.append("🖼️  Pet Image Path Update - COMPLETE!")
+    out.append("=" * 60)
     
-    print("📂 BEFORE (Old Paths):")
-    print("   ❌ assets/pet/ghost.png")
-    print("   ❌ assets/pet/clock.png") 
-    print("   ❌ assets/pet/house.png")
+    out.append("📂 BEFORE (Old Paths):")
+    out.append("   ❌ assets/pet/ghost.png")
+    out.append("   ❌ assets/pet/clock.png") 
+    out.append("   ❌ assets/pet/house.png")
     
-    print("\n📂 AFTER (New Paths):")
-    print("   ✅ react-app/public/ghost.png")
-    print("   ✅ react-app/public/clock.png")
-    print("   ✅ react-app/public/house.png")
+    out.append("\n📂 AFTER (New Paths):")
+    out.append("   ✅ react-app/public/ghost.png")
+    out.append("   ✅ react-app/public/clock.png")
+    out.append("   ✅ react-app/public/house.png")
     
-    print("\n📊 File Verification:")
+    out.append("\n📊 File Verification:")
     public_folder = "react-app/public/"
     images = ["ghost.png", "clock.png", "house.png"]
     
+    # One directory read; DirEntry caches its stat (free on Windows)
+    entries = dir_entries(public_folder)
     for img in images:
         path = public_folder + img
-        exists = os.path.exists(path)
-        status = "✅ FOUND" if exists else "❌ MISSING"
-        size_info = ""
+        try:
+            st = entries[img].stat()
+        except (KeyError, OSError):  # not listed, or vanished/broken link
+            st = None
+        status = "✅ FOUND" if st is not None else "❌ MISSING"
+        size_info = f" ({st.st_size / 1024:.1f} KB)" if st is not None else ""
         
-        if exists:
-            try:
-                size = os.path.getsize(path)
-                size_kb = size / 1024
-                size_info = f" ({size_kb:.1f} KB)"
-            except:
-                size_info = ""
-        
-        print(f"   {status} {path}{size_info}")
+        out.append(f"   {status} {path}{size_info}")
     
-    print("\n🎭 Pet Options Available:")
+    out.append("\n🎭 Pet Options Available:")
     pets = [
         ("👻 Ghost Pixie", "mysterious and helpful"),
         ("⏰ Time Keeper", "punctual and organized"), 
@@ -48,23 +50,25 @@ def show_update_summary():
     ]
     
     for name, personality in pets:
-        print(f"   {name} - {personality}")
+        out.append(f"   {name} - {personality}")
+    
+    out.append("\n🚀 How to Use:")
+    out.append("   1. Run: python main.py")
+    out.append("   2. Right-click the pet")
+    out.append("   3. Settings ► Change Pet ►")
+    out.append("   4. Select your favorite!")
+    out.append("   5. Watch it change to the PNG from public folder!")
     
-    print("\n🚀 How to Use:")
-    print("   1. Run: python main.py")
-    print("   2. Right-click the pet")
-    print("   3. Settings ► Change Pet ►")
-    print("   4. Select your favorite!")
-    print("   5. Watch it change to the PNG from public folder!")
+    out.append("\n✨ Update Summary:")
+    out.append("   ✅ Configuration updated in settings.json")
+    out.append("   ✅ Pet manager code updated")
+    out.append("   ✅ All image paths now point to react-app/public/")
+    out.append("   ✅ Image files verified and accessible")
+    out.append("   ✅ Pet switching fully functional")
     
-    print("\n✨ Update Summary:")
-    print("   ✅ Configuration updated in settings.json")
-    print("   ✅ Pet manager code updated")
-    print("   ✅ All image paths now point to react-app/public/")
-    print("   ✅ Image files verified and accessible")
-    print("   ✅ Pet switching fully functional")
+    out.append(f"\n🎉 SUCCESS! Your pet will now use the PNG images from the public folder!")
     
-    print(f"\n🎉 SUCCESS! Your pet will now use the PNG images from the public folder!")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     show_update_summary()
\ No newline at end of file
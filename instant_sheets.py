@@ -13,31 +13,56 @@ class InstantSheetsLogger:
     
     def __init__(self, filename="pixie_log.csv"):
         self.filename = filename
+        self._fh = None
         self.setup_csv()
     
     def setup_csv(self):
-        """Create CSV with headers if it doesn't exist"""
-        if not os.path.exists(self.filename):
-            with open(self.filename, 'w', newline='', encoding='utf-8') as f:
-                writer = csv.writer(f)
-                writer.writerow(['Timestamp', 'Activity', 'Description', 'Duration', 'Notes'])
+        """Open the CSV for appending, writing headers if the file is new or empty"""
+        # One handle for the logger's lifetime instead of open/close per row;
+        # append mode starts at the end, so tell() doubles as the size check
+        self.close()
+        self._fh = open(self.filename, 'a', newline='', encoding='utf-8')
+        self._writer = csv.writer(self._fh)
+        if self._fh.tell() == 0:
+            self._writer.writerow(['Timestamp', 'Activity', 'Description', 'Duration', 'Notes'])
+            self._fh.flush()
+    
+    @staticmethod
+    def _format_row(timestamp, activity_type, description, duration_minutes=0, notes=""):
+        """Build one CSV row"""
+        return (
+            timestamp,
+            activity_type,
+            description,
+            f"{duration_minutes} min" if duration_minutes > 0 else "",
+            notes or "Added by Pixie"
+        )
     
     def log_activity(self, activity_type, description, duration_minutes=0, notes=""):
         """Log activity to CSV"""
         timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-        
-        with open(self.filename, 'a', newline='', encoding='utf-8') as f:
-            writer = csv.writer(f)
-            writer.writerow([
-                timestamp, 
-                activity_type, 
-                description, 
-                f"{duration_minutes} min" if duration_minutes > 0 else "",
-                notes or "Added by Pixie"
-            ])
-        
+        self._writer.writerow(
+            self._format_row(timestamp, activity_type, description, duration_minutes, notes)
+        )
+        # Flushed per call (per batch in log_activities) so a crash never
+        # loses a logged row and readers of the CSV see it straight away
+        self._fh.flush()
         return True
     
+    def log_activities(self, activities):
+        """Log many (activity_type, description, duration_minutes, notes) tuples at once"""
+        timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+        self._writer.writerows(
+            self._format_row(timestamp, *activity) for activity in activities
+        )
+        self._fh.flush()
+        return True
+    
+    def close(self):
+        """Flush and release the CSV file; safe to call more than once"""
+        if self._fh is not None and not self._fh.closed:
+            self._fh.close()
+    
     def get_google_sheets_import_url(self):
         """Generate URL to import CSV directly to Google Sheets"""
         # This opens a new Google Sheet and prompts to import the CSV
@@ -87,8 +112,8 @@ def demo_instant_sheets():
     ]
     
     print("📝 Logging sample activities...")
+    logger.log_activities(sample_activities)
     for activity, desc, duration, notes in sample_activities:
-        logger.log_activity(activity, desc, duration, notes)
         print(f"   ✅ {activity}: {desc}")
     
     print(f"\n📂 Data saved to: {os.path.abspath(logger.filename)}")
@@ -5,10 +5,26 @@ This script helps you see the actual differences between pet images
 to confirm that switching is working visually.
 """
 
+import hashlib
 import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+try:
+    from PIL import Image
+except ImportError:
+    Image = None
+
+def _file_md5(path, chunk_size=64 * 1024):
+    """MD5 of a file's bytes, read in chunks rather than decoding the image"""
+    with open(path, 'rb') as f:
+        if hasattr(hashlib, 'file_digest'):  # Python 3.11+
+            return hashlib.file_digest(f, 'md5').hexdigest()
+        h = hashlib.md5()
+        for chunk in iter(lambda: f.read(chunk_size), b''):
+            h.update(chunk)
+        return h.hexdigest()
+
 def show_image_differences():
     print("🖼️  Pet Image Visual Analysis")
     print("=" * 50)
@@ -19,34 +35,37 @@ def show_image_differences():
         ("Home Guardian", "react-app/public/house.png")
     ]
     
+    if Image is None:
+        print("❌ PIL not available for image analysis")
+        return
+    
     try:
-        from PIL import Image
-        import hashlib
-        
         print("📊 Image Comparison:")
         
+        # Previews decode and resample every image, so only do it when
+        # someone is at the terminal to look at them
+        show_images = (sys.stdin.isatty() and sys.stdout.isatty()
+                       and os.environ.get('PIXIE_SHOW_IMAGES', '1') == '1')
+        
         # Calculate image hashes to detect differences
         hashes = {}
         
         for name, path in images:
             if os.path.exists(path):
-                img = Image.open(path)
-                
-                # Convert to bytes and calculate hash
-                img_bytes = img.tobytes()
-                img_hash = hashlib.md5(img_bytes).hexdigest()
+                # Hash the file itself; opening with PIL only parses the
+                # header for size/mode, so no pixels are decoded
+                img_hash = _file_md5(path)
                 hashes[name] = img_hash
+                with Image.open(path) as img:
+                    size = img.size
+                    # Check if image has transparency
+                    has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
                 
                 print(f"\n🐾 {name}")
                 print(f"   Path: {path}")
-                print(f"   Size: {img.size}")
+                print(f"   Size: {size}")
                 print(f"   Hash: {img_hash[:16]}...")
-                
-                # Check if image has transparency
-                has_alpha = img.mode in ('RGBA', 'LA') or 'transparency' in img.info
                 print(f"   Transparency: {'Yes' if has_alpha else 'No'}")
-                
-                img.close()
             else:
                 print(f"\n🐾 {name}")
                 print(f"   ❌ File not found: {path}")
@@ -68,7 +87,10 @@ def show_image_differences():
         
         # Try to open images for manual inspection
         print(f"\n🔬 Manual Inspection:")
-        print("   The images will be opened for visual inspection...")
+        if not show_images:
+            print("   Skipped (not a terminal, or PIXIE_SHOW_IMAGES=0)")
+        else:
+            print("   The images will be opened for visual inspection...")
         print("   Look for these differences:")
         print("   • Ghost: Should show a ghost/spirit character")
         print("   • Clock: Should show a clock or time-related image") 
@@ -76,16 +98,15 @@ def show_image_differences():
         
         # Open each image for visual inspection
         for name, path in images:
-            if os.path.exists(path):
+            if show_images and name in hashes:
                 try:
-                    img = Image.open(path)
                     print(f"\n   Opening {name}...")
-                    
-                    # Create a smaller preview
-                    img.thumbnail((300, 300))
-                    
-                    # Show the image (this will open default image viewer)
-                    img.show()
+                    with Image.open(path) as img:
+                        # Create a smaller preview
+                        img.thumbnail((300, 300))
+                        
+                        # Show the image (this will open default image viewer)
+                        img.show()
                     
                     input(f"   Press Enter after viewing {name}...")
                     
@@ -104,8 +125,6 @@ def show_image_differences():
         print("   3. Watch carefully for visual changes")
         print("   4. The logs confirm the switching is working!")
         
-    except ImportError:
-        print("❌ PIL not available for image analysis")
     except Exception as e:
         print(f"❌ Error: {e}")
 
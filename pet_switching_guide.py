@@ -8,51 +8,53 @@ import os
 import sys
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
+from src.utils.helpers import dir_entries
+
 def show_image_switching_guide():
-    print("🎭 HOW TO SWITCH PET IMAGES - Complete Guide")
-    print("=" * 60)
+    # The whole guide goes to stdout in a single write
+    out = []
+    
+    out.append("🎭 HOW TO SWITCH PET IMAGES - Complete Guide")
+    out.append("=" * 60)
     
-    print("\n🎮 METHOD 1: In-App Switching (Easiest)")
-    print("   1. Run: python main.py")
-    print("   2. Wait for the pet to appear on screen")
-    print("   3. RIGHT-CLICK on the pet")
-    print("   4. Select: Settings ►")
-    print("   5. Select: Change Pet ►")
-    print("   6. Choose: Ghost Pixie, Time Keeper, or Home Guardian")
-    print("   7. Watch the pet change instantly!")
+    out.append("\n🎮 METHOD 1: In-App Switching (Easiest)")
+    out.append("   1. Run: python main.py")
+    out.append("   2. Wait for the pet to appear on screen")
+    out.append("   3. RIGHT-CLICK on the pet")
+    out.append("   4. Select: Settings ►")
+    out.append("   5. Select: Change Pet ►")
+    out.append("   6. Choose: Ghost Pixie, Time Keeper, or Home Guardian")
+    out.append("   7. Watch the pet change instantly!")
     
-    print("\n📁 METHOD 2: Replace Image Files")
-    print("   Location: react-app/public/")
-    print("   Current files:")
+    out.append("\n📁 METHOD 2: Replace Image Files")
+    out.append("   Location: react-app/public/")
+    out.append("   Current files:")
     
     public_folder = "react-app/public/"
     images = ["ghost.png", "clock.png", "house.png"]
     
+    # One directory read; DirEntry caches its stat (free on Windows)
+    entries = dir_entries(public_folder)
     for img in images:
         path = public_folder + img
-        exists = os.path.exists(path)
-        status = "✅" if exists else "❌"
-        size_info = ""
+        try:
+            st = entries[img].stat()
+        except (KeyError, OSError):  # not listed, or vanished/broken link
+            st = None
+        status = "✅" if st is not None else "❌"
+        size_info = f" ({st.st_size / 1024:.1f} KB)" if st is not None else ""
         
-        if exists:
-            try:
-                size = os.path.getsize(path)
-                size_kb = size / 1024
-                size_info = f" ({size_kb:.1f} KB)"
-            except:
-                pass
-        
-        print(f"   {status} {path}{size_info}")
+        out.append(f"   {status} {path}{size_info}")
     
-    print("\n   📝 To replace images:")
-    print("   • Replace ghost.png with your ghost image")
-    print("   • Replace clock.png with your clock image")
-    print("   • Replace house.png with your house image")
-    print("   • Keep the same filenames!")
+    out.append("\n   📝 To replace images:")
+    out.append("   • Replace ghost.png with your ghost image")
+    out.append("   • Replace clock.png with your clock image")
+    out.append("   • Replace house.png with your house image")
+    out.append("   • Keep the same filenames!")
     
-    print("\n⚙️  METHOD 3: Edit Configuration File")
-    print("   File: config/settings.json")
-    print("   Section to edit:")
+    out.append("\n⚙️  METHOD 3: Edit Configuration File")
+    out.append("   File: config/settings.json")
+    out.append("   Section to edit:")
     
     try:
         from src.utils.config_manager import ConfigManager
@@ -62,43 +64,45 @@ def show_image_switching_guide():
         available_pets = settings.get('pet', {}).get('available_pets', {})
         current_pet = settings.get('pet', {}).get('current_pet', 'ghost')
         
-        print('   "available_pets": {')
+        out.append('   "available_pets": {')
         for pet_id, pet_info in available_pets.items():
             current_marker = " ← CURRENT" if pet_id == current_pet else ""
-            print(f'     "{pet_id}": {{')
-            print(f'       "name": "{pet_info.get("name", "Unknown")}",')
-            print(f'       "image": "{pet_info.get("image", "Unknown")}",{current_marker}')
-            print(f'       "personality": "{pet_info.get("personality", "Unknown")}"')
-            print('     },')
-        print('   }')
+            out.append(f'     "{pet_id}": {{')
+            out.append(f'       "name": "{pet_info.get("name", "Unknown")}",')
+            out.append(f'       "image": "{pet_info.get("image", "Unknown")}",{current_marker}')
+            out.append(f'       "personality": "{pet_info.get("personality", "Unknown")}"')
+            out.append('     },')
+        out.append('   }')
         
-        print(f'\n   Current active pet: "{current_pet}"')
+        out.append(f'\n   Current active pet: "{current_pet}"')
         
     except Exception as e:
-        print(f"   ❌ Could not read config: {e}")
+        out.append(f"   ❌ Could not read config: {e}")
+    
+    out.append("\n🔄 METHOD 4: Command Line Switching")
+    out.append("   Run these demo scripts:")
+    out.append("   • python test_pet_switching_fixed.py  (Interactive)")
+    out.append("   • python final_pet_demo.py           (Automatic)")
     
-    print("\n🔄 METHOD 4: Command Line Switching")
-    print("   Run these demo scripts:")
-    print("   • python test_pet_switching_fixed.py  (Interactive)")
-    print("   • python final_pet_demo.py           (Automatic)")
+    out.append("\n📂 Current File Locations:")
+    out.append("   🖼️  Images: react-app/public/*.png")
+    out.append("   ⚙️  Config: config/settings.json")
+    out.append("   🐾 Pet Logic: src/pet/pet_manager.py")
     
-    print("\n📂 Current File Locations:")
-    print("   🖼️  Images: react-app/public/*.png")
-    print("   ⚙️  Config: config/settings.json")
-    print("   🐾 Pet Logic: src/pet/pet_manager.py")
+    out.append("\n💡 Quick Switch Tips:")
+    out.append("   • Images auto-resize to pet window size")
+    out.append("   • PNG format recommended for transparency")
+    out.append("   • Changes save automatically")
+    out.append("   • Restart pet app to see file replacements")
     
-    print("\n💡 Quick Switch Tips:")
-    print("   • Images auto-resize to pet window size")
-    print("   • PNG format recommended for transparency")
-    print("   • Changes save automatically")
-    print("   • Restart pet app to see file replacements")
+    out.append("\n🎯 What Happens When You Switch:")
+    out.append("   1. Pet appearance changes immediately")
+    out.append("   2. Personality message updates") 
+    out.append("   3. Settings saved to config file")
+    out.append("   4. Activity logged to CSV")
+    out.append("   5. Speech bubble shows confirmation")
     
-    print("\n🎯 What Happens When You Switch:")
-    print("   1. Pet appearance changes immediately")
-    print("   2. Personality message updates") 
-    print("   3. Settings saved to config file")
-    print("   4. Activity logged to CSV")
-    print("   5. Speech bubble shows confirmation")
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     show_image_switching_guide()
\ No newline at end of file
@@ -10,41 +10,44 @@ import os
 sys.path.append(os.path.join(os.path.dirname(__file__), 'src'))
 
 def show_feature_summary():
-    print("🎭 Pet Switching Feature Implementation")
-    print("=" * 60)
+    # Collected and written once; dozens of print() calls each hit the console
+    out = []
     
-    print("\n✨ NEW FEATURES ADDED:")
-    print("1. 🐾 Multiple Pet Options:")
-    print("   • Ghost Pixie (mysterious and helpful)")
-    print("   • Time Keeper (punctual and organized)") 
-    print("   • Home Guardian (cozy and protective)")
+    out.append("🎭 Pet Switching Feature Implementation")
+    out.append("=" * 60)
     
-    print("\n2. 🎮 User Interface:")
-    print("   • Right-click pet → Settings ► Change Pet ►")
-    print("   • Visual checkmark shows current pet")
-    print("   • Instant switching with confirmation")
+    out.append("\n✨ NEW FEATURES ADDED:")
+    out.append("1. 🐾 Multiple Pet Options:")
+    out.append("   • Ghost Pixie (mysterious and helpful)")
+    out.append("   • Time Keeper (punctual and organized)") 
+    out.append("   • Home Guardian (cozy and protective)")
     
-    print("\n3. 🖼️ Visual Changes:")
-    print("   • Each pet has unique image (clock.png, house.png, ghost.png)")
-    print("   • Automatic image loading and resizing")
-    print("   • Smooth visual transitions")
+    out.append("\n2. 🎮 User Interface:")
+    out.append("   • Right-click pet → Settings ► Change Pet ►")
+    out.append("   • Visual checkmark shows current pet")
+    out.append("   • Instant switching with confirmation")
     
-    print("\n4. 💾 Persistence:")
-    print("   • Pet selection saved to config/settings.json")
-    print("   • Remembers choice between app restarts")
-    print("   • Auto-logging to CSV for activity tracking")
+    out.append("\n3. 🖼️ Visual Changes:")
+    out.append("   • Each pet has unique image (clock.png, house.png, ghost.png)")
+    out.append("   • Automatic image loading and resizing")
+    out.append("   • Smooth visual transitions")
     
-    print("\n📁 FILES MODIFIED/CREATED:")
-    print("   • config/settings.json - Added pet options")
-    print("   • src/pet/pet_manager.py - Pet switching logic")
-    print("   • test_pet_switching_fixed.py - Demo script")
+    out.append("\n4. 💾 Persistence:")
+    out.append("   • Pet selection saved to config/settings.json")
+    out.append("   • Remembers choice between app restarts")
+    out.append("   • Auto-logging to CSV for activity tracking")
     
-    print("\n🎯 HOW TO USE:")
-    print("1. Run the pet application (python main.py)")
-    print("2. Right-click on the pet")
-    print("3. Navigate: Settings ► Change Pet ►")
-    print("4. Select your preferred pet")
-    print("5. Watch it transform!")
+    out.append("\n📁 FILES MODIFIED/CREATED:")
+    out.append("   • config/settings.json - Added pet options")
+    out.append("   • src/pet/pet_manager.py - Pet switching logic")
+    out.append("   • test_pet_switching_fixed.py - Demo script")
+    
+    out.append("\n🎯 HOW TO USE:")
+    out.append("1. Run the pet application (python main.py)")
+    out.append("2. Right-click on the pet")
+    out.append("3. Navigate: Settings ► Change Pet ►")
+    out.append("4. Select your preferred pet")
+    out.append("5. Watch it transform!")
     
     # Show current configuration
     try:
@@ -55,21 +58,23 @@ def show_feature_summary():
         current_pet = settings.get('pet', {}).get('current_pet', 'ghost')
         available_pets = settings.get('pet', {}).get('available_pets', {})
         
-        print(f"\n📊 CURRENT CONFIGURATION:")
-        print(f"   Active Pet: {current_pet}")
+        out.append(f"\n📊 CURRENT CONFIGURATION:")
+        out.append(f"   Active Pet: {current_pet}")
         
         if available_pets:
-            print(f"   Available Pets: {len(available_pets)}")
+            out.append(f"   Available Pets: {len(available_pets)}")
             for pet_id, pet_info in available_pets.items():
                 status = " ✅" if pet_id == current_pet else " ⭕"
-                print(f"     {status} {pet_info.get('name', pet_id)}")
+                out.append(f"     {status} {pet_info.get('name', pet_id)}")
         
-        print(f"\n✅ Pet switching is ready to use!")
+        out.append(f"\n✅ Pet switching is ready to use!")
         
     except Exception as e:
-        print(f"\n⚠️  Configuration check failed: {e}")
+        out.append(f"\n⚠️  Configuration check failed: {e}")
+    
+    out.append("\n" + "=" * 60)
     
-    print("\n" + "=" * 60)
+    sys.stdout.write("\n".join(out) + "\n")
 
 if __name__ == "__main__":
     show_feature_summary()
\ No newline at end of file
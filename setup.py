@@ -6,6 +6,7 @@ This script helps users set up the project dependencies and configuration
 
 import sys
 import os
+import shutil
 import subprocess
 import logging
 from pathlib import Path
@@ -46,7 +47,10 @@ def install_requirements():
         cmd = [python_exe, "-m", "pip", "install", "-r", str(requirements_file)]
         
         print(f"Running: {' '.join(cmd)}")
-        result = subprocess.run(cmd, capture_output=True, text=True, check=True)
+        # pip's progress log is only useful on failure, so discard stdout
+        # and keep stderr for the error report
+        subprocess.run(cmd, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE,
+                       text=True, check=True)
         
         print("✅ Dependencies installed successfully!")
         return True
@@ -73,9 +77,8 @@ def setup_environment():
         return True
     
     if env_example.exists():
-        # Copy example to .env
-        with open(env_example, 'r') as src, open(env_file, 'w') as dst:
-            dst.write(src.read())
+        # Copy example to .env (contents only, using the OS fast copy path)
+        shutil.copyfile(env_example, env_file)
         
         print("✅ Created .env file from template")
         print("⚠️  Please edit .env and add your Gemini API key!")
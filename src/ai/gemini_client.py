@@ -728,7 +728,9 @@ Analyze the screenshot and decide whether to comment:"""
             
             prompt += f"**User says:** {message}\n\n**Respond naturally as Pixie:**"
             
-            response = self.model.generate_content(prompt)
+            # Async variant so the event loop (and concurrent callers) aren't
+            # blocked for the whole network round-trip
+            response = await self.model.generate_content_async(prompt)
             
             if response.text:
                 return response.text.strip()
@@ -3,9 +3,12 @@ File Manager
 Handles safe file operations for code generation and editing
 """
 
+import heapq
 import os
 import shutil
+import stat
 import logging
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, Any, Optional, List
 from datetime import datetime
@@ -135,8 +138,7 @@ class FileManager:
             path.parent.mkdir(parents=True, exist_ok=True)
             
             # Write content
-            with open(path, 'w', encoding='utf-8') as f:
-                f.write(content)
+            path.write_text(content, encoding='utf-8')
             
             self.logger.info(f"Successfully wrote file: {path}")
             
@@ -255,19 +257,22 @@ class FileManager:
         try:
             files = []
             
+            # One stat per entry feeds the file check, mtime and size
             for item in self.workspace_root.rglob('*'):
-                if item.is_file() and self.is_safe_file(str(item)):
+                try:
+                    st = item.stat()
+                except OSError:
+                    continue
+                if stat.S_ISREG(st.st_mode) and self.is_safe_file(str(item)):
                     files.append({
                         'path': str(item.relative_to(self.workspace_root)),
                         'name': item.name,
-                        'modified': datetime.fromtimestamp(item.stat().st_mtime),
-                        'size': item.stat().st_size
+                        'modified': datetime.fromtimestamp(st.st_mtime),
+                        'size': st.st_size
                     })
             
-            # Sort by modification time (newest first)
-            files.sort(key=lambda x: x['modified'], reverse=True)
-            
-            return files[:limit]
+            # Newest first; only the top `limit` entries need ordering
+            return heapq.nlargest(limit, files, key=itemgetter('modified'))
             
         except Exception as e:
             self.logger.error(f"Error getting recent files: {e}")
@@ -314,17 +319,19 @@ class FileManager:
             if not self.backup_dir.exists():
                 return backups
             
-            for backup_file in self.backup_dir.iterdir():
-                if backup_file.is_file():
-                    backups.append({
-                        'name': backup_file.name,
-                        'path': str(backup_file),
-                        'size': backup_file.stat().st_size,
-                        'created': datetime.fromtimestamp(backup_file.stat().st_ctime)
-                    })
+            with os.scandir(self.backup_dir) as entries:
+                for entry in entries:
+                    if entry.is_file():
+                        st = entry.stat()
+                        backups.append({
+                            'name': entry.name,
+                            'path': entry.path,
+                            'size': st.st_size,
+                            'created': datetime.fromtimestamp(st.st_ctime)
+                        })
             
             # Sort by creation time (newest first)
-            backups.sort(key=lambda x: x['created'], reverse=True)
+            backups.sort(key=itemgetter('created'), reverse=True)
             
             return backups
             
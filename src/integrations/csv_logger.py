@@ -12,9 +12,13 @@ import logging
 class CSVSheetsLogger:
     """Simple CSV logger for Google Sheets integration"""
     
+    HEADERS = ('Timestamp', 'Activity Type', 'Description', 'Duration', 'File/Context', 'Notes')
+    
     def __init__(self, filename="pixie_activity_log.csv"):
         self.filename = filename
         self.logger = logging.getLogger(__name__)
+        # Rows in the file, counted once and then kept current on each write
+        self._row_count = None
         self.setup_csv()
     
     def setup_csv(self):
@@ -23,28 +27,35 @@ class CSVSheetsLogger:
             if not os.path.exists(self.filename):
                 with open(self.filename, 'w', newline='', encoding='utf-8') as f:
                     writer = csv.writer(f)
-                    writer.writerow(['Timestamp', 'Activity Type', 'Description', 'Duration', 'File/Context', 'Notes'])
+                    writer.writerow(self.HEADERS)
+                self._row_count = 0
                 self.logger.info(f"Created new CSV log file: {self.filename}")
         except Exception as e:
             self.logger.error(f"Failed to setup CSV: {e}")
     
+    @staticmethod
+    def _timestamp():
+        """Current time in the log's timestamp format"""
+        return datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    
+    @staticmethod
+    def _format_row(timestamp, activity_type, description, duration_minutes=0, context="", notes="Added by Pixie"):
+        """Build one CSV row for an activity"""
+        duration_str = f"{duration_minutes} min" if duration_minutes > 0 else ""
+        return (timestamp, activity_type, description, duration_str, context, notes)
+    
     def log_activity(self, activity_type, description, duration_minutes=0, context="", notes="Added by Pixie"):
         """Log activity to CSV"""
         try:
-            timestamp = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
-            duration_str = f"{duration_minutes} min" if duration_minutes > 0 else ""
+            row = self._format_row(self._timestamp(), activity_type, description,
+                                   duration_minutes, context, notes)
             
             with open(self.filename, 'a', newline='', encoding='utf-8') as f:
                 writer = csv.writer(f)
-                writer.writerow([
-                    timestamp,
-                    activity_type,
-                    description,
-                    duration_str,
-                    context,
-                    notes
-                ])
+                writer.writerow(row)
             
+            if self._row_count is not None:
+                self._row_count += 1
             self.logger.info(f"Logged to CSV: {activity_type} - {description}")
             return True
             
@@ -52,6 +63,31 @@ class CSVSheetsLogger:
             self.logger.error(f"Failed to log to CSV: {e}")
             return False
     
+    def log_activities(self, activities):
+        """Log many activities in one pass
+        
+        Each item is a tuple of log_activity arguments. Rows are formatted
+        lazily and streamed straight into the writer, so the file is opened
+        once and no intermediate list of rows is built. The whole batch
+        shares one timestamp.
+        """
+        try:
+            timestamp = self._timestamp()
+            rows = (self._format_row(timestamp, *activity) for activity in activities)
+            
+            with open(self.filename, 'a', newline='', encoding='utf-8') as f:
+                writer = csv.writer(f)
+                writer.writerows(rows)
+            
+            # Batch size is unknown up front, so recount lazily next time
+            self._row_count = None
+            self.logger.info("Logged activity batch to CSV")
+            return True
+            
+        except Exception as e:
+            self.logger.error(f"Failed to log to CSV: {e}")
+            return False
+    
     def log_coding_session(self, file_name, action="Coding", duration_minutes=0):
         """Log a coding session"""
         return self.log_activity(
@@ -116,8 +152,13 @@ Auto-update: Each time Pixie logs new activities, re-import the file to update y
     
     def get_row_count(self):
         """Get number of rows in the CSV (excluding header)"""
+        if self._row_count is not None:
+            return self._row_count
         try:
-            with open(self.filename, 'r', encoding='utf-8') as f:
-                return sum(1 for line in f) - 1  # Subtract header row
+            # csv.reader yields plain lists (no per-row dicts) and keeps
+            # quoted multi-line descriptions as a single record
+            with open(self.filename, 'r', newline='', encoding='utf-8') as f:
+                self._row_count = sum(1 for _ in csv.reader(f)) - 1  # Subtract header row
+            return self._row_count
         except:
             return 0
\ No newline at end of file
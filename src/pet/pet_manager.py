@@ -12,6 +12,8 @@ import threading
 import sys
 import time
 import random
+import itertools
+from collections import deque
 from pathlib import Path
 from PIL import Image, ImageTk
 
@@ -48,6 +50,21 @@ except ImportError:
     get_style_manager = None
     get_theme = None
 
+# Import performance tuning (lives next to main.py)
+try:
+    from PERFORMANCE_CONFIG import (PERF, compute_interval, make_conversation_history,
+                                    make_activity_history, SPONTANEOUS_ACTIVITY_WINDOW,
+                                    SPONTANEOUS_INTERVAL_MODEL)
+    SPONTANEOUS_BASE_INTERVAL = SPONTANEOUS_INTERVAL_MODEL["low"][1]
+    IDLE_SLEEP_MULTIPLIER = PERF.idle_sleep_multiplier
+except ImportError:
+    compute_interval = None
+    SPONTANEOUS_ACTIVITY_WINDOW = 600.0
+    SPONTANEOUS_BASE_INTERVAL = 60.0
+    IDLE_SLEEP_MULTIPLIER = 2
+    make_conversation_history = lambda: deque(maxlen=50)
+    make_activity_history = lambda: deque(maxlen=20)
+
 # Import speech managers
 try:
     from src.ui.speech_manager import SpeechManager
@@ -71,6 +88,9 @@ try:
 except ImportError as e:
     GoogleSheetsManager = None
 
+# Drag moves are applied at most once per frame (~60 Hz)
+DRAG_FRAME_MS = 16
+
 class PetManager:
     """Main manager for the virtual pet assistant"""
     
@@ -176,9 +196,10 @@ class PetManager:
         self.current_context = None
         self.chat_history = []
         self.conversation_messages = []  # Store conversation for speech bubbles
+        self.modern_chat = None  # Open ModernChatWindow, cleared when it is destroyed
         
         # Enhanced conversation state
-        self.conversation_history = []  # Recent conversation for context
+        self.conversation_history = make_conversation_history()  # Recent conversation for context
         self.last_spontaneous_comment_time = 0
         
         # Google Sheets integration
@@ -218,17 +239,12 @@ class PetManager:
         self.current_mood = "helpful"  # Pet's current mood
         self.personality_traits = ["helpful", "friendly", "curious"]
         
-        # Memory management limits
-        self.MAX_CONVERSATION_HISTORY = 50  # Limit conversation memory
-        self.MAX_ACTIVITY_HISTORY = 20      # Limit activity tracking
-        self.conversation_history = []       # Initialize conversation history
-        
         # Memory-efficient activity tracking with limits
         self.activity_tracker = {
             "last_activity": None,
             "activity_start_time": None,
             "inactivity_count": 0,
-            "recent_activities": []
+            "recent_activities": make_activity_history()
         }
         
         # Drag state for smooth dragging
@@ -236,6 +252,12 @@ class PetManager:
         self.drag_start_x = 0
         self.drag_start_y = 0
         self.click_time = 0
+        # Motion events are coalesced into at most one move per DRAG_FRAME_MS
+        self._drag_target = None
+        self._drag_pending = False
+        self._last_drag_xy = None
+        self._drag_max_x = 0
+        self._drag_max_y = 0
         
         self.logger.info("Pet Manager initialized")
     
@@ -492,7 +514,6 @@ class PetManager:
     
     def _on_pet_press(self, event):
         """Handle mouse press on pet - start drag or prepare for click"""
-        import time
         self.click_time = time.time()
         self.dragging = False
         
@@ -500,13 +521,19 @@ class PetManager:
         self.drag_start_x = event.x_root - self.pet_window.winfo_x()
         self.drag_start_y = event.y_root - self.pet_window.winfo_y()
         
+        # Screen and window sizes don't change mid-drag, so resolve the
+        # allowed range once here instead of on every motion event
+        screen_width = self.pet_window.winfo_screenwidth()
+        screen_height = self.pet_window.winfo_screenheight()
+        margin = 10
+        self._drag_max_x = screen_width - self.pet_window.winfo_width() + margin
+        self._drag_max_y = screen_height - self.pet_window.winfo_height() + margin
+        
         # Change cursor to indicate draggable
         self.pet_window.config(cursor="fleur")
     
     def _on_pet_drag(self, event):
         """Handle pet dragging - move the window"""
-        import time
-        
         # Start dragging immediately if mouse has moved (more responsive)
         if not self.dragging and time.time() - self.click_time > 0.05:
             self.dragging = True
@@ -521,23 +548,31 @@ class PetManager:
             new_x = event.x_root - self.drag_start_x
             new_y = event.y_root - self.drag_start_y
             
-            # Keep pet within screen bounds
-            screen_width = self.pet_window.winfo_screenwidth()
-            screen_height = self.pet_window.winfo_screenheight()
-            pet_width = self.pet_window.winfo_width()
-            pet_height = self.pet_window.winfo_height()
-            
             # Constrain to screen bounds with small margin
             margin = 10
-            new_x = max(-margin, min(new_x, screen_width - pet_width + margin))
-            new_y = max(-margin, min(new_y, screen_height - pet_height + margin))
-            
-            # Move the window smoothly
-            self.pet_window.geometry(f"+{new_x}+{new_y}")
+            new_x = max(-margin, min(new_x, self._drag_max_x))
+            new_y = max(-margin, min(new_y, self._drag_max_y))
+            
+            # Coalesce bursts of motion events into one move per frame
+            self._drag_target = (new_x, new_y)
+            if not self._drag_pending:
+                self._drag_pending = True
+                self.pet_window.after(DRAG_FRAME_MS, self._flush_pet_drag)
+    
+    def _flush_pet_drag(self):
+        """Apply the latest drag position, skipping no-op moves"""
+        self._drag_pending = False
+        target = self._drag_target
+        if target is None or target == self._last_drag_xy:
+            return
+        self._last_drag_xy = target
+        self.pet_window.geometry("+%d+%d" % target)
     
     def _on_pet_release(self, event):
         """Handle mouse release - save position or handle click"""
-        import time
+        # Land exactly where the pointer was released before saving
+        if self.dragging:
+            self._flush_pet_drag()
         
         # Reset cursor
         self.pet_window.config(cursor="")
@@ -576,7 +611,7 @@ class PetManager:
             "Your virtual companion at work! 💼",
             "I'm learning about your workflow! 📊"
         ]
-        self.message_index = 0
+        self._message_cycle = itertools.cycle(self.conversation_messages)
     
     async def _show_pet_message(self):
         """Show a speech bubble message from the pet"""
@@ -584,8 +619,7 @@ class PetManager:
             return
         
         # Get next message in rotation
-        message = self.conversation_messages[self.message_index]
-        self.message_index = (self.message_index + 1) % len(self.conversation_messages)
+        message = next(self._message_cycle)
         
         # Show the message with typing effect
         self.speech_bubble.show_message(message, typing_effect=True)
@@ -835,7 +869,7 @@ class PetManager:
     
     async def _open_chat_interface(self):
         """Open the modern chat interface window"""
-        if hasattr(self, 'modern_chat') and self.modern_chat.window and self.modern_chat.window.winfo_exists():
+        if self.modern_chat is not None:
             self.modern_chat.window.lift()
             return
         
@@ -845,6 +879,7 @@ class PetManager:
             self.chat_window = self.modern_chat.window
             self.chat_display = self.modern_chat.chat_display
             self.chat_input = self.modern_chat.chat_input
+            self.chat_window.bind("<Destroy>", self._on_modern_chat_destroyed, add="+")
             
             # Get buttons and connect events
             send_button, analyze_button = self.modern_chat._create_input_area()
@@ -1038,7 +1073,7 @@ class PetManager:
                     self.logger.warning(f"Could not get VS Code context: {e}")
             
             # Add recent activity context
-            enhanced_context['activity_history'] = self.activity_tracker.get('recent_activities', [])[-5:]
+            enhanced_context['activity_history'] = list(self.activity_tracker.get('recent_activities', []))[-5:]
             enhanced_context['current_mood'] = self.current_mood
             
         except Exception as e:
@@ -1198,9 +1233,15 @@ class PetManager:
             self.logger.error(f"Error showing analysis results: {e}")
             await self._show_speech_bubble("❌ Analysis complete but display failed. Check logs.", duration=3000)
     
+    def _on_modern_chat_destroyed(self, event):
+        """Forget the chat window once it closes so the next open builds a new one"""
+        # Children's <Destroy> events also reach the toplevel binding
+        if self.modern_chat is not None and event.widget is self.modern_chat.window:
+            self.modern_chat = None
+    
     def _add_modern_chat_message(self, sender: str, message: str) -> str:
         """Add a message with modern styling"""
-        if hasattr(self, 'modern_chat') and self.modern_chat:
+        if self.modern_chat is not None:
             # Use modern chat window method
             self.modern_chat.add_message(sender, message)
             return "modern_message"
@@ -2339,19 +2380,24 @@ class PetManager:
         except Exception as e:
             self.logger.error(f"Error applying theme to pet window: {e}")
     
+    def _recent_activity_count(self, now: float) -> int:
+        """Number of tracked activities that started within the recent window"""
+        cutoff = now - SPONTANEOUS_ACTIVITY_WINDOW
+        return sum(1 for activity in self.activity_tracker["recent_activities"]
+                   if activity.get("start_time", 0) >= cutoff)
+    
     async def _start_spontaneous_conversations(self):
         """Start the spontaneous conversation system with adaptive timing"""
-        import time
-        import random
-        
         # Adaptive sleep intervals based on activity
-        base_interval = 60  # Base check interval: 60 seconds
+        base_interval = SPONTANEOUS_BASE_INTERVAL  # Quiet end of the interval model
         
         while self.is_running:
             try:
                 # Adaptive sleep based on user activity
                 if self.activity_tracker.get("inactivity_count", 0) > 5:
-                    sleep_time = base_interval * 2  # Less frequent when idle
+                    sleep_time = base_interval * IDLE_SLEEP_MULTIPLIER  # Less frequent when idle
+                elif compute_interval:
+                    sleep_time = compute_interval(self._recent_activity_count(time.time()))
                 else:
                     sleep_time = base_interval
                 
@@ -2384,8 +2430,6 @@ class PetManager:
     async def _make_spontaneous_comment(self):
         """Generate and show a spontaneous comment"""
         try:
-            import time
-            
             # Get current screenshot for context
             screenshot = self.screen_monitor.get_screenshot()
             if not screenshot:
@@ -2424,7 +2468,7 @@ class PetManager:
         """Add message to conversation history with optimized memory management"""
         # Ensure conversation_history exists
         if not hasattr(self, 'conversation_history'):
-            self.conversation_history = []
+            self.conversation_history = make_conversation_history()
         
         # Truncate long messages to save memory
         truncated_message = message[:500] if len(message) > 500 else message
@@ -2433,16 +2477,10 @@ class PetManager:
             "speaker": speaker,
             "text": truncated_message,
             "timestamp": time.time()
-        })
-        
-        # Maintain memory limit - use configured limit
-        if len(self.conversation_history) > self.MAX_CONVERSATION_HISTORY:
-            self.conversation_history = self.conversation_history[-self.MAX_CONVERSATION_HISTORY:]
+        })  # Bounded deque drops the oldest message once full
     
     def _update_mood(self):
         """Update pet's mood based on context"""
-        import random
-        
         moods = ["helpful", "playful", "curious", "encouraging", "sleepy", "excited"]
         
         # Weight moods based on current activity
@@ -2461,8 +2499,6 @@ class PetManager:
     
     async def _track_user_activity(self, context: Dict[str, Any]):
         """Track user activity for better conversation context"""
-        import time
-        
         current_time = time.time()
         
         # Determine activity type from context
@@ -2488,11 +2524,7 @@ class PetManager:
                 "type": activity_type,
                 "context": context_summary,
                 "start_time": current_time
-            })
-            
-            # Maintain memory limits - use configured limit
-            if len(self.activity_tracker["recent_activities"]) > self.MAX_ACTIVITY_HISTORY:
-                self.activity_tracker["recent_activities"] = self.activity_tracker["recent_activities"][-self.MAX_ACTIVITY_HISTORY:]
+            })  # Bounded deque drops the oldest activity once full
         
         # Track inactivity
         if activity_type == "idle":
@@ -2516,7 +2548,7 @@ class PetManager:
             # Use enhanced conversational response
             response = await self.gemini_client.conversational_response(
                 message,
-                conversation_history=self.conversation_history,
+                conversation_history=list(self.conversation_history),
                 context=context,
                 personality_traits=self.personality_traits
             )
@@ -2547,7 +2579,6 @@ class PetManager:
                 "idle": 0.1       # 10% chance to check on idle user
             }
             
-            import random
             if activity in reaction_triggers and random.random() < reaction_triggers[activity]:
                 reaction = await self.gemini_client.react_to_activity(
                     activity, 
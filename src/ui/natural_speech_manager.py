@@ -8,6 +8,8 @@ import logging
 import tempfile
 import os
 import io
+import re
+from functools import lru_cache
 from typing import Optional, Dict, Any
 import time
 
@@ -26,6 +28,108 @@ except ImportError:
     PYGAME_AVAILABLE = False
     pygame = None
 
+# Markdown characters that should never be read aloud
+_MARKDOWN_STRIP = str.maketrans('', '', '*_#')
+
+# British kid vocabulary and expressions
+_BRITISH_KID_REPLACEMENTS = {
+    # Basic American -> British kid
+    'awesome': 'dead brilliant',
+    'cool': 'proper ace',
+    'great': 'dead good',
+    'amazing': 'absolutely smashing',
+    'fantastic': 'dead brilliant',
+    'wonderful': 'lovely',
+    'excellent': 'top notch',
+    'perfect': 'spot on',
+    
+    # Greetings & responses (kid-like)
+    'okay': 'righto',
+    'ok': 'righto', 
+    'hi': 'hiya',
+    'hello': 'hiya there',
+    'hey': 'oi oi',
+    'hey there': 'hiya mate',
+    'thanks': 'cheers mate',
+    'thank you': 'ta loads',
+    'you\'re welcome': 'no worries mate',
+    'sure': 'dead cert',
+    'yes': 'yeah mate',
+    'no': 'nah mate',
+    
+    # Emotions (British kid style)
+    'excited': 'dead chuffed',
+    'happy': 'chuffed to bits',
+    'sad': 'proper gutted',
+    'angry': 'well cross',
+    'surprised': 'gobsmacked',
+    'confused': 'proper muddled',
+    'tired': 'dead knackered',
+    'hungry': 'dead peckish',
+    'thirsty': 'gasping',
+    
+    # Actions (British kid)
+    'quickly': 'dead quick',
+    'slowly': 'dead slow',
+    'carefully': 'dead careful like',
+    'immediately': 'right now',
+    'later': 'in a bit',
+    'soon': 'dead soon',
+    
+    # British items kids know
+    'candy': 'sweets',
+    'cookies': 'biscuits', 
+    'soda': 'fizzy drink',
+    'french fries': 'chips',
+    'chips': 'crisps',
+    'soccer': 'footy',
+    'vacation': 'hols',
+    'bathroom': 'loo',
+    'elevator': 'lift',
+    'apartment': 'flat',
+    'garbage': 'rubbish',
+    'flashlight': 'torch',
+    'sweater': 'jumper',
+    
+    # Intensifiers (British kid style)
+    'very': 'dead',
+    'really': 'proper',
+    'quite': 'dead',
+    'so': 'well',
+    'totally': 'dead',
+    'completely': 'proper',
+    
+    # Kid expressions
+    'weird': 'dead weird',
+    'strange': 'proper odd',
+    'funny': 'dead funny',
+    'silly': 'daft',
+    'stupid': 'barmy',
+    'crazy': 'mental',
+    'loud': 'dead loud',
+    'quiet': 'dead quiet',
+    
+    # Enthusiasm 
+    'wow': 'blimey',
+    'whoa': 'crikey',
+    'oh my': 'blimey me',
+    'gosh': 'crikey',
+    'jeez': 'blimey',
+    'darn': 'bloomin\' heck',
+    'shoot': 'blooming heck',
+}
+
+
+@lru_cache(maxsize=1)
+def _british_kid_patterns():
+    """Compiled vocabulary patterns, longest phrase first to avoid partial replacements"""
+    ordered = sorted(_BRITISH_KID_REPLACEMENTS.items(), key=lambda x: len(x[0]), reverse=True)
+    return tuple(
+        (re.compile(r'\b' + re.escape(american) + r'\b', re.IGNORECASE), british_kid)
+        for american, british_kid in ordered
+    )
+
+
 class NaturalSpeechManager:
     """Enhanced speech manager with natural British voices using Google TTS"""
     
@@ -209,103 +313,12 @@ class NaturalSpeechManager:
         """Enhance text for British pronunciation and child-like speech patterns"""
         
         # Clean text first
-        clean_text = text.replace('*', '').replace('_', '').replace('#', '')
-        
-        # British kid vocabulary and expressions
-        british_kid_replacements = {
-            # Basic American -> British kid
-            'awesome': 'dead brilliant',
-            'cool': 'proper ace',
-            'great': 'dead good',
-            'amazing': 'absolutely smashing',
-            'fantastic': 'dead brilliant',
-            'wonderful': 'lovely',
-            'excellent': 'top notch',
-            'perfect': 'spot on',
-            
-            # Greetings & responses (kid-like)
-            'okay': 'righto',
-            'ok': 'righto', 
-            'hi': 'hiya',
-            'hello': 'hiya there',
-            'hey': 'oi oi',
-            'hey there': 'hiya mate',
-            'thanks': 'cheers mate',
-            'thank you': 'ta loads',
-            'you\'re welcome': 'no worries mate',
-            'sure': 'dead cert',
-            'yes': 'yeah mate',
-            'no': 'nah mate',
-            
-            # Emotions (British kid style)
-            'excited': 'dead chuffed',
-            'happy': 'chuffed to bits',
-            'sad': 'proper gutted',
-            'angry': 'well cross',
-            'surprised': 'gobsmacked',
-            'confused': 'proper muddled',
-            'tired': 'dead knackered',
-            'hungry': 'dead peckish',
-            'thirsty': 'gasping',
-            
-            # Actions (British kid)
-            'quickly': 'dead quick',
-            'slowly': 'dead slow',
-            'carefully': 'dead careful like',
-            'immediately': 'right now',
-            'later': 'in a bit',
-            'soon': 'dead soon',
-            
-            # British items kids know
-            'candy': 'sweets',
-            'cookies': 'biscuits', 
-            'soda': 'fizzy drink',
-            'french fries': 'chips',
-            'chips': 'crisps',
-            'soccer': 'footy',
-            'vacation': 'hols',
-            'bathroom': 'loo',
-            'elevator': 'lift',
-            'apartment': 'flat',
-            'garbage': 'rubbish',
-            'flashlight': 'torch',
-            'sweater': 'jumper',
-            
-            # Intensifiers (British kid style)
-            'very': 'dead',
-            'really': 'proper',
-            'quite': 'dead',
-            'so': 'well',
-            'totally': 'dead',
-            'completely': 'proper',
-            
-            # Kid expressions
-            'weird': 'dead weird',
-            'strange': 'proper odd',
-            'funny': 'dead funny',
-            'silly': 'daft',
-            'stupid': 'barmy',
-            'crazy': 'mental',
-            'loud': 'dead loud',
-            'quiet': 'dead quiet',
-            
-            # Enthusiasm 
-            'wow': 'blimey',
-            'whoa': 'crikey',
-            'oh my': 'blimey me',
-            'gosh': 'crikey',
-            'jeez': 'blimey',
-            'darn': 'bloomin\' heck',
-            'shoot': 'blooming heck',
-        }
+        clean_text = text.translate(_MARKDOWN_STRIP)
         
-        # Apply British kid vocabulary (sort by length to avoid partial replacements)
-        import re
-        sorted_replacements = sorted(british_kid_replacements.items(), key=lambda x: len(x[0]), reverse=True)
         
-        for american, british_kid in sorted_replacements:
-            pattern = r'\b' + re.escape(american) + r'\b'
-            clean_text = re.sub(pattern, british_kid, clean_text, flags=re.IGNORECASE)
+        # Apply British kid vocabulary (patterns are compiled once and reused)
+        for pattern, british_kid in _british_kid_patterns():
+            clean_text = pattern.sub(british_kid, clean_text)
         
         # Add British child-like speech patterns
         if self.british_accent:
@@ -4,6 +4,7 @@ Creates dynamic animations and visual effects for the modern pet UI
 """
 
 import math
+import random
 import time
 import tkinter as tk
 from typing import List, Tuple, Callable
@@ -130,7 +131,7 @@ class PetAnimator:
                 # Bounce up and down
                 offset = math.sin(step * 0.3) * 10
                 # Apply offset to pet position
-                self.canvas.after(50, lambda: bounce_step(step + 1))
+                self.canvas.after(50, bounce_step, step + 1)
             elif callback:
                 callback()
         
@@ -152,9 +153,12 @@ class PetAnimator:
 class ParticleSystem:
     """Particle system for magical effects"""
     
+    FRAME_MS = 50  # 20 FPS, same as PetAnimator
+    
     def __init__(self, canvas: tk.Canvas):
         self.canvas = canvas
         self.particles = []
+        self._after_id = None
         
     class Particle:
         def __init__(self, x, y, vx, vy, life, color="#FFD700", size=2):
@@ -182,15 +186,30 @@ class ParticleSystem:
         if colors is None:
             colors = ["#FFD700", "#FF69B4", "#87CEEB", "#98FB98"]
             
-        for _ in range(count):
-            import random
+        # Draw the discrete picks for the whole burst up front
+        burst_colors = random.choices(colors, k=count)
+        lives = random.choices(range(30, 61), k=count)
+        
+        for color, life in zip(burst_colors, lives):
             vx = random.uniform(-3, 3)
             vy = random.uniform(-5, -1)
-            life = random.randint(30, 60)
-            color = random.choice(colors)
             
             particle = self.Particle(x, y, vx, vy, life, color)
             self.particles.append(particle)
+        
+        self._ensure_running()
+    
+    def _ensure_running(self):
+        """Start the frame loop unless one is already scheduled"""
+        if self._after_id is None:
+            self._after_id = self.canvas.after(self.FRAME_MS, self._tick)
+    
+    def _tick(self):
+        """Single fixed-rate loop shared by every burst"""
+        self._after_id = None
+        self.update()
+        if self.particles and self.canvas.winfo_exists():
+            self._after_id = self.canvas.after(self.FRAME_MS, self._tick)
     
     def update(self):
         """Update all particles"""
@@ -231,19 +250,18 @@ class VisualEffects:
     @staticmethod
     def create_ripple_effect(canvas: tk.Canvas, x: int, y: int, max_radius: int = 50):
         """Create an expanding ripple effect"""
+        # One oval per ripple, grown in place with coords instead of being
+        # deleted and recreated on every step
+        item = canvas.create_oval(x - 5, y - 5, x + 5, y + 5, outline="#4A90E2", width=2, tags="ripple")
+        
         def animate_ripple(radius=5):
+            if not canvas.type(item):
+                return  # Cleared from the canvas mid-animation
             if radius < max_radius:
-                canvas.delete("ripple")
-                alpha = 1 - (radius / max_radius)
-                
-                canvas.create_oval(
-                    x - radius, y - radius, x + radius, y + radius,
-                    outline="#4A90E2", width=2, tags="ripple"
-                )
-                
-                canvas.after(50, lambda: animate_ripple(radius + 5))
+                canvas.coords(item, x - radius, y - radius, x + radius, y + radius)
+                canvas.after(50, animate_ripple, radius + 5)
             else:
-                canvas.delete("ripple")
+                canvas.delete(item)
         
         animate_ripple()
     
@@ -280,7 +298,6 @@ class VisualEffects:
         
         def shake_step(step=0):
             if step < 20:
-                import random
                 offset_x = random.randint(-intensity, intensity)
                 offset_y = random.randint(-intensity, intensity)
                 
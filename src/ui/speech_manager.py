@@ -8,6 +8,21 @@ import logging
 from typing import Optional, Dict, Any
 import time
 
+# Markdown characters to drop and symbols to read out as words
+_SPEECH_TRANSLATION = str.maketrans({
+    '*': None,
+    '_': None,
+    '#': None,
+    '&': ' and ',
+    '@': ' at ',
+    '%': ' percent ',
+    '$': ' dollars ',
+    '+': ' plus ',
+    '=': ' equals ',
+    '<': ' less than ',
+    '>': ' greater than ',
+})
+
 class SpeechManager:
     """Manages text-to-speech functionality for the desktop pet"""
     
@@ -111,23 +126,8 @@ class SpeechManager:
     
     def _clean_text_for_speech(self, text: str) -> str:
         """Clean text to make it more suitable for speech"""
-        # Remove common markdown or formatting
-        clean_text = text.replace('*', '').replace('_', '').replace('#', '')
-        
-        # Replace some symbols with words
-        replacements = {
-            '&': ' and ',
-            '@': ' at ',
-            '%': ' percent ',
-            '$': ' dollars ',
-            '+': ' plus ',
-            '=': ' equals ',
-            '<': ' less than ',
-            '>': ' greater than ',
-        }
-        
-        for symbol, word in replacements.items():
-            clean_text = clean_text.replace(symbol, word)
+        # Strip markdown and spell out symbols in a single pass
+        clean_text = text.translate(_SPEECH_TRANSLATION)
         
         # Apply British pronunciation if enabled
         if self.british_style:
@@ -75,6 +75,17 @@ class ModernTheme:
         self.colors = self._load_colors()
         self.fonts = self._load_fonts()
         
+    @property
+    def colors(self) -> Dict[str, str]:
+        """Active color palette"""
+        return self._colors
+    
+    @colors.setter
+    def colors(self, colors: Dict[str, str]) -> None:
+        # Every palette swap rebuilds the lookup cache, so it can never go stale
+        self._colors = colors
+        self._color_cache = {**self.DEFAULT_COLORS, **colors}
+    
     def _get_theme_mode(self) -> bool:
         """Get current theme mode from config"""
         ui_config = self.config.get("ui", {})
@@ -100,7 +111,7 @@ class ModernTheme:
     
     def get_color(self, color_name: str) -> str:
         """Get color by name"""
-        return self.colors.get(color_name, self.DEFAULT_COLORS.get(color_name, "#000000"))
+        return self._color_cache.get(color_name, "#000000")
     
     def get_font(self, font_name: str) -> Tuple:
         """Get font by name"""
@@ -322,6 +333,8 @@ class StyleManager:
         self.config = self._load_config(config_path)
         self.theme = ModernTheme(self.config)
         self._theme_change_callbacks = []
+        # (root, palette) the ttk styles were last configured for
+        self._styled_for = None
         
     def _load_config(self, config_path: str = None) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -411,6 +424,13 @@ class StyleManager:
     
     def apply_global_styles(self, root: tk.Tk):
         """Apply global styles to the application"""
+        # Palette dicts are replaced (never mutated) on theme changes, so an
+        # identity check tells us whether the styles are already current
+        if self._styled_for is not None:
+            styled_root, styled_palette = self._styled_for
+            if styled_root is root and styled_palette is self.theme.colors:
+                return
+        
         # Configure ttk styles
         style = ttk.Style()
         
@@ -441,6 +461,8 @@ class StyleManager:
         
         # Set default font
         root.option_add("*Font", self.theme.get_font("primary"))
+        
+        self._styled_for = (root, self.theme.colors)
 
 
 # Global style manager instance
@@ -4,9 +4,25 @@ Handles loading and saving application settings
 """
 
 import json
-import os
 from pathlib import Path
-from typing import Dict, Any
+from typing import Dict, Any, Union
+
+try:
+    import orjson  # optional: decodes bytes directly and several times faster
+except ImportError:
+    orjson = None
+
+def _loads(data: Union[bytes, str]) -> Any:
+    """Parse JSON with orjson when available, else the standard library"""
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+def _dumps(config: Dict[str, Any]) -> bytes:
+    """Serialize config as indented UTF-8 JSON bytes"""
+    if orjson is not None:
+        return orjson.dumps(config, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS)
+    return json.dumps(config, indent=2, ensure_ascii=False).encode('utf-8')
 
 class ConfigManager:
     """Manages application configuration"""
@@ -61,8 +77,7 @@ class ConfigManager:
         """Load configuration from file or create with defaults"""
         try:
             if self.config_file.exists():
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    config = json.load(f)
+                config = _loads(self.config_file.read_bytes())
                 # Merge with defaults to ensure all keys exist
                 return self._merge_config(self.default_config, config)
             else:
@@ -79,8 +94,10 @@ class ConfigManager:
             # Ensure config directory exists
             self.config_dir.mkdir(parents=True, exist_ok=True)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(config, f, indent=2, ensure_ascii=False)
+            # Serialize in memory and hand the file a single write; json.dump
+            # would push every indented token through a separate write() call
+            data = _dumps(config)
+            self.config_file.write_bytes(data)
             return True
         except Exception as e:
             print(f"Error saving config: {e}")
@@ -46,6 +46,14 @@ def hash_string(text: str) -> str:
     """Generate a hash for a string"""
     return hashlib.md5(text.encode()).hexdigest()
 
+def dir_entries(path) -> Dict[str, os.DirEntry]:
+    """Entries of a directory by name from one scandir (empty if it is missing)"""
+    try:
+        with os.scandir(path) as it:
+            return {entry.name: entry for entry in it}
+    except OSError:
+        return {}
+
 def format_file_size(size_bytes: int) -> str:
     """Format file size in human readable format"""
     if size_bytes == 0:
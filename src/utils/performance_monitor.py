@@ -148,44 +148,44 @@ class PerformanceMonitor:
         """Generate performance report"""
         current_memory = self._get_memory_usage()
         
-        # Calculate averages for recent metrics
-        recent_cpu = [m["value"] for m in self.metrics["cpu_usage"][-20:]]
-        recent_frames = [m["value"] for m in self.metrics["frame_times"][-50:]]
-        recent_ai = [m["value"] for m in self.metrics["ai_response_times"][-10:]]
-        
         report = {
             "current_memory_mb": current_memory,
-            "avg_cpu_percent": sum(recent_cpu) / len(recent_cpu) if recent_cpu else 0,
-            "avg_frame_time": sum(recent_frames) / len(recent_frames) if recent_frames else 0,
-            "avg_ai_response_time": sum(recent_ai) / len(recent_ai) if recent_ai else 0,
+            "avg_cpu_percent": self._recent_average("cpu_usage", 20),
+            "avg_frame_time": self._recent_average("frame_times", 50),
+            "avg_ai_response_time": self._recent_average("ai_response_times", 10),
             "slow_operations_count": len(self.metrics["slow_operations"]),
-            "recommendations": self._generate_recommendations()
+            "recommendations": self._generate_recommendations(current_memory)
         }
         
         return report
     
-    def _generate_recommendations(self) -> List[str]:
+    def _recent_average(self, metric: str, window: int) -> float:
+        """Mean of the last `window` samples of a metric"""
+        recent = self.metrics[metric][-window:]
+        if not recent:
+            return 0
+        return sum(s["value"] for s in recent) / len(recent)
+    
+    def _generate_recommendations(self, current_memory: Optional[float] = None) -> List[str]:
         """Generate performance improvement recommendations"""
         recommendations = []
-        current_memory = self._get_memory_usage()
+        if current_memory is None:
+            current_memory = self._get_memory_usage()
         
         # Memory recommendations
         if current_memory > 150:  # Over 150MB
             recommendations.append("High memory usage detected. Consider reducing conversation history limit.")
         
         # CPU recommendations  
-        recent_cpu = [m["value"] for m in self.metrics["cpu_usage"][-10:]]
-        if recent_cpu and sum(recent_cpu) / len(recent_cpu) > 10:
+        if self._recent_average("cpu_usage", 10) > 10:
             recommendations.append("High CPU usage. Consider reducing screen capture frequency.")
         
         # Frame rate recommendations
-        recent_frames = [m["value"] for m in self.metrics["frame_times"][-20:]]
-        if recent_frames and sum(recent_frames) / len(recent_frames) > 0.05:
+        if self._recent_average("frame_times", 20) > 0.05:
             recommendations.append("Slow UI rendering. Consider reducing UI update frequency.")
         
         # AI response recommendations
-        recent_ai = [m["value"] for m in self.metrics["ai_response_times"][-5:]]
-        if recent_ai and sum(recent_ai) / len(recent_ai) > 8:
+        if self._recent_average("ai_response_times", 5) > 8:
             recommendations.append("Slow AI responses. Check API connection and reduce context size.")
         
         if not recommendations:
@@ -36,6 +36,24 @@ async def main():
         print(f"  ✅ Logged: {activity} - {description}")
         time.sleep(0.1)  # Small delay for realistic timing
     
+    # Log a batch in one write
+    print("\n📦 Logging a batch of activities...")
+    
+    batch = [
+        ("Code Review", "Reviewed CSV batch logging", 20),
+        ("Documentation", "Updated Google Sheets guide", 10)
+    ]
+    
+    success = csv_logger.log_activities(
+        (activity, description, duration, "", "Demo Batch")
+        for activity, description, duration in batch
+    )
+    if success:
+        for activity, description, _ in batch:
+            print(f"  ✅ Logged: {activity} - {description}")
+    else:
+        print("  ❌ Batch logging failed")
+    
     # Show file info
     print(f"\n📊 CSV File Location: {csv_logger.get_file_path()}")
     print(f"📈 Total Entries: {csv_logger.get_row_count()}")
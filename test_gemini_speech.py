@@ -69,11 +69,17 @@ async def test_gemini_speech():
         print("\n🎭 Test 4: Different Moods")
         moods = ["helpful", "playful", "encouraging", "curious"]
         
-        for mood in moods:
-            response = await client.conversational_response(
+        # The mood requests are independent, so overlap their network round-trips
+        coros = [
+            client.conversational_response(
                 "I'm feeling a bit stuck on this problem",
                 personality_traits=[mood, "friendly"]
             )
+            for mood in moods
+        ]
+        responses = await asyncio.gather(*coros)
+        
+        for mood, response in zip(moods, responses):
             print(f"Pixie ({mood}): {response}")
         
         # Test 5: Spontaneous comment (would need screenshot in real app)